@@ -4,12 +4,14 @@ Phase 7.3: Support Bot API Router
 FastAPI router for the AI support chat functionality.
 """
 
-from typing import Optional
+import json
+from typing import AsyncIterator, Optional
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 import uuid
 
-from app.workflows.support_bot import process_support_message
+from app.workflows.support_bot import process_support_message, stream_support_answer
 
 
 router = APIRouter()
@@ -90,6 +92,36 @@ async def chat_with_support_bot(request: SupportChatRequest) -> SupportChatRespo
         )
 
 
+@router.post("/support/chat/stream")
+async def stream_chat_with_support_bot(request: SupportChatRequest) -> StreamingResponse:
+    """
+    Stream a support chat answer over Server-Sent Events.
+
+    Emits `data: {"delta": ...}` frames as tokens arrive and a final
+    `data: {"done": true, ...}` frame with the session metadata, so the
+    chat UI can render the answer progressively.
+    """
+
+    if not request.messages:
+        raise HTTPException(status_code=400, detail="Messages cannot be empty")
+
+    session_id = request.session_id or str(uuid.uuid4())
+    messages = [{"role": m.role, "content": m.content} for m in request.messages]
+
+    async def event_stream() -> AsyncIterator[str]:
+        async for event in stream_support_answer(
+            messages=messages,
+            user_id=request.user_id,
+            organization_id=request.organization_id,
+            session_id=session_id,
+        ):
+            if event.get("done"):
+                event["session_id"] = session_id
+            yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @router.get("/support/categories")
 async def get_support_categories() -> dict:
     """Get available support categories."""
@@ -39,21 +39,13 @@ async def process_voice_message(request: VoiceProcessingRequest) -> VoiceProcess
     """
     try:
         # Initialize workflow state
-        initial_state: VoiceProcessingState = {
-            "message_id": request.message_id,
-            "audio_url": request.audio_url,
-            "customer_phone": request.customer_phone,
-            "organization_id": request.organization_id,
-            "conversation_history": request.conversation_history,
-            "status": "transcribing",
-            "transcription": None,
-            "extraction": None,
-            "confidence": None,
-            "job_id": None,
-            "error": None,
-            "confirmation_sent": False,
-            "confirmation_message_id": None,
-        }
+        initial_state = VoiceProcessingState(
+            message_id=request.message_id,
+            audio_url=request.audio_url,
+            customer_phone=request.customer_phone,
+            organization_id=request.organization_id,
+            conversation_history=request.conversation_history,
+        )
         
         # Execute workflow
         result = await voice_workflow.ainvoke(initial_state)
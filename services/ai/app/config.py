@@ -26,11 +26,19 @@ class Settings(BaseSettings):
     # WhatsApp API
     WHATSAPP_API_URL: str = "http://localhost:3000/api/whatsapp"
     WHATSAPP_API_KEY: str = ""
+    # Cap on in-flight sends; the Cloud API allows ~80 msg/s per number,
+    # so the bound protects the backend without throttling normal bursts
+    WHATSAPP_MAX_CONCURRENT_SENDS: int = 50
     
     # CampoTech Backend
     CAMPOTECH_API_URL: str = "http://localhost:3000"
     CAMPOTECH_API_KEY: str = ""
     
+    # LLM response cache (support bot): Redis when REDIS_URL is set,
+    # otherwise a local SQLite file
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_PATH: str = ".support_bot_cache.db"
+
     # Service config
     LOG_LEVEL: str = "INFO"
     ENVIRONMENT: str = "development"
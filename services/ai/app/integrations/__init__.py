@@ -1,5 +1,6 @@
 """Integrations package for external services."""
 
+from app.integrations.http import close_integrations_client
 from app.integrations.openai_client import (
     download_audio,
     extract_job_data,
@@ -18,6 +19,8 @@ from app.integrations.whatsapp import (
 )
 
 __all__ = [
+    # Shared HTTP client
+    "close_integrations_client",
     # OpenAI
     "download_audio",
     "transcribe_audio",
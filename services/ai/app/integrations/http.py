@@ -0,0 +1,20 @@
+"""
+Shared HTTP client for the integrations layer.
+"""
+
+import httpx
+
+
+# One pooled client for every outbound call (backend API, WhatsApp
+# gateway, media downloads): requests reuse keep-alive connections
+# instead of paying a TCP+TLS handshake each. Timeouts stay per-request
+# at the call sites.
+http_client = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+)
+
+
+async def close_integrations_client() -> None:
+    """Close the pooled client at application shutdown."""
+    await http_client.aclose()
@@ -10,23 +10,32 @@ import openai
 from openai import AsyncOpenAI
 
 from app.config import settings
+from app.integrations.http import http_client
 from app.models.schemas import ConversationMessage, JobExtraction
 
 
-# Initialize async client
-client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+# Initialize async client - shared across all callers so every LLM call
+# reuses one keep-alive connection pool (HTTP/2 multiplexed) instead of
+# paying a TCP+TLS handshake per request
+client = AsyncOpenAI(
+    api_key=settings.OPENAI_API_KEY,
+    http_client=httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        timeout=60.0,
+    ),
+)
 
 
 async def download_audio(audio_url: str) -> bytes:
     """Download audio file from WhatsApp media URL."""
-    async with httpx.AsyncClient() as http_client:
-        response = await http_client.get(
-            audio_url,
-            headers={"Authorization": f"Bearer {settings.WHATSAPP_API_KEY}"},
-            timeout=30.0,
-        )
-        response.raise_for_status()
-        return response.content
+    response = await http_client.get(
+        audio_url,
+        headers={"Authorization": f"Bearer {settings.WHATSAPP_API_KEY}"},
+        timeout=30.0,
+    )
+    response.raise_for_status()
+    return response.content
 
 
 async def transcribe_audio(audio_data: bytes, language: str = "es") -> str:
@@ -4,9 +4,8 @@ PostgreSQL integration for database operations.
 
 from typing import Any, Optional
 
-import httpx
-
 from app.config import settings
+from app.integrations.http import http_client
 
 
 async def create_job(
@@ -27,37 +26,36 @@ async def create_job(
     Returns:
         Created job data including ID
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{settings.CAMPOTECH_API_URL}/api/jobs",
-            json={
-                "organization_id": organization_id,
-                "customer_phone": customer_phone,
-                "title": extraction_data.get("title", "Nuevo trabajo"),
-                "description": extraction_data.get("description", ""),
-                "service_type": extraction_data.get("service_type"),
-                "address": extraction_data.get("address"),
-                "city": extraction_data.get("city"),
-                "province": extraction_data.get("province"),
-                "scheduled_date": extraction_data.get("preferred_date"),
-                "scheduled_time": extraction_data.get("preferred_time"),
-                "urgency": extraction_data.get("urgency", "normal"),
-                "appliance_brand": extraction_data.get("appliance_brand"),
-                "appliance_model": extraction_data.get("appliance_model"),
-                "metadata": {
-                    "source": source,
-                    "extraction_confidence": extraction_data.get("overall_confidence"),
-                    "field_confidences": extraction_data.get("field_confidences"),
-                },
-            },
-            headers={
-                "Authorization": f"Bearer {settings.CAMPOTECH_API_KEY}",
-                "Content-Type": "application/json",
+    response = await http_client.post(
+        f"{settings.CAMPOTECH_API_URL}/api/jobs",
+        json={
+            "organization_id": organization_id,
+            "customer_phone": customer_phone,
+            "title": extraction_data.get("title", "Nuevo trabajo"),
+            "description": extraction_data.get("description", ""),
+            "service_type": extraction_data.get("service_type"),
+            "address": extraction_data.get("address"),
+            "city": extraction_data.get("city"),
+            "province": extraction_data.get("province"),
+            "scheduled_date": extraction_data.get("preferred_date"),
+            "scheduled_time": extraction_data.get("preferred_time"),
+            "urgency": extraction_data.get("urgency", "normal"),
+            "appliance_brand": extraction_data.get("appliance_brand"),
+            "appliance_model": extraction_data.get("appliance_model"),
+            "metadata": {
+                "source": source,
+                "extraction_confidence": extraction_data.get("overall_confidence"),
+                "field_confidences": extraction_data.get("field_confidences"),
             },
-            timeout=30.0,
-        )
-        response.raise_for_status()
-        return response.json()
+        },
+        headers={
+            "Authorization": f"Bearer {settings.CAMPOTECH_API_KEY}",
+            "Content-Type": "application/json",
+        },
+        timeout=30.0,
+    )
+    response.raise_for_status()
+    return response.json()
 
 
 async def add_to_review_queue(
@@ -70,7 +68,7 @@ async def add_to_review_queue(
 ) -> dict[str, Any]:
     """
     Add a voice message to the human review queue.
-    
+
     Args:
         organization_id: Organization ID
         message_id: WhatsApp message ID
@@ -78,30 +76,29 @@ async def add_to_review_queue(
         extraction_data: Extracted data for review
         confidence: Overall confidence score
         customer_phone: Customer phone number
-        
+
     Returns:
         Created review queue entry
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{settings.CAMPOTECH_API_URL}/api/voice-review",
-            json={
-                "organization_id": organization_id,
-                "message_id": message_id,
-                "transcription": transcription,
-                "extraction": extraction_data,
-                "confidence": confidence,
-                "customer_phone": customer_phone,
-                "status": "pending_review",
-            },
-            headers={
-                "Authorization": f"Bearer {settings.CAMPOTECH_API_KEY}",
-                "Content-Type": "application/json",
-            },
-            timeout=30.0,
-        )
-        response.raise_for_status()
-        return response.json()
+    response = await http_client.post(
+        f"{settings.CAMPOTECH_API_URL}/api/voice-review",
+        json={
+            "organization_id": organization_id,
+            "message_id": message_id,
+            "transcription": transcription,
+            "extraction": extraction_data,
+            "confidence": confidence,
+            "customer_phone": customer_phone,
+            "status": "pending_review",
+        },
+        headers={
+            "Authorization": f"Bearer {settings.CAMPOTECH_API_KEY}",
+            "Content-Type": "application/json",
+        },
+        timeout=30.0,
+    )
+    response.raise_for_status()
+    return response.json()
 
 
 async def update_message_status(
@@ -110,17 +107,23 @@ async def update_message_status(
     extraction_data: Optional[dict[str, Any]] = None,
     confidence: Optional[float] = None,
     status: Optional[str] = None,
+    detected_language: Optional[str] = None,
+    original_content: Optional[str] = None,
+    translated_content: Optional[str] = None,
 ) -> dict[str, Any]:
     """
     Update a WhatsApp message with processing results.
-    
+
     Args:
         message_id: WhatsApp message ID
         transcription: Transcribed text
         extraction_data: Extracted data
         confidence: Confidence score
         status: New status
-        
+        detected_language: ISO code of the detected language (Phase 5.2)
+        original_content: Original transcription before translation
+        translated_content: Spanish translation used for extraction
+
     Returns:
         Updated message data
     """
@@ -133,16 +136,21 @@ async def update_message_status(
         update_data["extraction_confidence"] = confidence
     if status is not None:
         update_data["ai_processing_status"] = status
+    if detected_language is not None:
+        update_data["detected_language"] = detected_language
+    if original_content is not None:
+        update_data["original_content"] = original_content
+    if translated_content is not None:
+        update_data["translated_content"] = translated_content
     
-    async with httpx.AsyncClient() as client:
-        response = await client.patch(
-            f"{settings.CAMPOTECH_API_URL}/api/whatsapp/messages/{message_id}",
-            json=update_data,
-            headers={
-                "Authorization": f"Bearer {settings.CAMPOTECH_API_KEY}",
-                "Content-Type": "application/json",
-            },
-            timeout=30.0,
-        )
-        response.raise_for_status()
-        return response.json()
+    response = await http_client.patch(
+        f"{settings.CAMPOTECH_API_URL}/api/whatsapp/messages/{message_id}",
+        json=update_data,
+        headers={
+            "Authorization": f"Bearer {settings.CAMPOTECH_API_KEY}",
+            "Content-Type": "application/json",
+        },
+        timeout=30.0,
+    )
+    response.raise_for_status()
+    return response.json()
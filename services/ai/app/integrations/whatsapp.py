@@ -2,11 +2,17 @@
 WhatsApp API integration for sending messages.
 """
 
+import asyncio
 from typing import Any, Optional
 
-import httpx
-
 from app.config import settings
+from app.integrations.http import http_client
+
+
+# Bounds in-flight sends across all workflows so a burst of voice
+# messages cannot open unbounded connections against the backend; the
+# limit tracks the Cloud API per-number throughput ceiling
+_SEND_SEMAPHORE = asyncio.Semaphore(settings.WHATSAPP_MAX_CONCURRENT_SENDS)
 
 
 async def send_message(
@@ -16,17 +22,17 @@ async def send_message(
 ) -> dict[str, Any]:
     """
     Send a WhatsApp text message via CampoTech's WhatsApp API.
-    
+
     Args:
         to: Recipient phone number
         text: Message text
         organization_id: Organization ID for routing
-        
+
     Returns:
         API response with message ID
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
+    async with _SEND_SEMAPHORE:
+        response = await http_client.post(
             f"{settings.CAMPOTECH_API_URL}/api/whatsapp/send",
             json={
                 "to": to,
@@ -62,8 +68,8 @@ async def send_interactive_buttons(
     Returns:
         API response with message ID
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
+    async with _SEND_SEMAPHORE:
+        response = await http_client.post(
             f"{settings.CAMPOTECH_API_URL}/api/whatsapp/send",
             json={
                 "to": to,
@@ -109,14 +115,13 @@ async def get_conversation_history(
     Returns:
         List of message objects
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{settings.CAMPOTECH_API_URL}/api/whatsapp/conversations/{phone}",
-            params={"organization_id": organization_id, "limit": limit},
-            headers={
-                "Authorization": f"Bearer {settings.CAMPOTECH_API_KEY}",
-            },
-            timeout=30.0,
-        )
-        response.raise_for_status()
-        return response.json().get("messages", [])
+    response = await http_client.get(
+        f"{settings.CAMPOTECH_API_URL}/api/whatsapp/conversations/{phone}",
+        params={"organization_id": organization_id, "limit": limit},
+        headers={
+            "Authorization": f"Bearer {settings.CAMPOTECH_API_KEY}",
+        },
+        timeout=30.0,
+    )
+    response.raise_for_status()
+    return response.json().get("messages", [])
@@ -4,7 +4,12 @@ Monitoring middleware for LangSmith integration.
 Provides tracing and observability for LangGraph workflows.
 """
 
+import logging
+import logging.handlers
 import os
+import queue
+import random
+from array import array
 from functools import wraps
 from typing import Any, Callable, TypeVar
 
@@ -12,6 +17,43 @@ from app.config import settings
 
 T = TypeVar("T")
 
+_log_listener: logging.handlers.QueueListener | None = None
+
+
+def setup_logging(level: int = logging.INFO) -> None:
+    """
+    Route application logging through a background queue.
+
+    Handlers that write to stdout/stderr acquire the stdio lock and can
+    block the event loop when output is piped; a QueueHandler makes the
+    emit side a lock-free enqueue and a QueueListener thread does the
+    actual I/O.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+    )
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    _log_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _log_listener.start()
+
+
+def shutdown_logging() -> None:
+    """Flush and stop the background logging listener."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
 
 def setup_langsmith() -> None:
     """Initialize LangSmith tracing."""
@@ -57,37 +99,66 @@ class MetricsCollector:
     Collect and report metrics for monitoring.
     
     In production, this would integrate with Prometheus/Grafana or similar.
+
+    Histograms keep a fixed-size reservoir sample (unboxed C doubles) plus
+    exact running count/sum/min/max, so memory per metric stays constant
+    while reported stats still describe the full observation stream.
     """
-    
+
+    # Reservoir capacity per histogram (Vitter's Algorithm R)
+    HISTOGRAM_SIZE = 10_000
+
     def __init__(self) -> None:
         self._counters: dict[str, int] = {}
-        self._histograms: dict[str, list[float]] = {}
-    
+        self._histograms: dict[str, array] = {}
+        # name -> [count, sum, min, max] over ALL observations
+        self._histogram_agg: dict[str, list[float]] = {}
+
     def increment(self, name: str, value: int = 1) -> None:
         """Increment a counter metric."""
         self._counters[name] = self._counters.get(name, 0) + value
-    
+
     def observe(self, name: str, value: float) -> None:
         """Record a histogram observation."""
-        if name not in self._histograms:
-            self._histograms[name] = []
-        self._histograms[name].append(value)
-    
+        buf = self._histograms.get(name)
+        if buf is None:
+            buf = array("d")
+            self._histograms[name] = buf
+            self._histogram_agg[name] = [0, 0.0, value, value]
+
+        agg = self._histogram_agg[name]
+        agg[0] += 1
+        agg[1] += value
+        if value < agg[2]:
+            agg[2] = value
+        if value > agg[3]:
+            agg[3] = value
+
+        if len(buf) < self.HISTOGRAM_SIZE:
+            buf.append(value)
+        else:
+            # Reservoir sampling: keep each observation with probability
+            # HISTOGRAM_SIZE / count so the sample stays representative
+            slot = random.randrange(int(agg[0]))
+            if slot < self.HISTOGRAM_SIZE:
+                buf[slot] = value
+
     def get_counter(self, name: str) -> int:
         """Get current counter value."""
         return self._counters.get(name, 0)
-    
+
     def get_histogram_stats(self, name: str) -> dict[str, float]:
-        """Get histogram statistics."""
-        values = self._histograms.get(name, [])
-        if not values:
+        """Get histogram statistics (exact over all observations)."""
+        agg = self._histogram_agg.get(name)
+        if not agg or not agg[0]:
             return {"count": 0, "avg": 0, "min": 0, "max": 0}
-        
+
+        count, total, minimum, maximum = agg
         return {
-            "count": len(values),
-            "avg": sum(values) / len(values),
-            "min": min(values),
-            "max": max(values),
+            "count": int(count),
+            "avg": total / count,
+            "min": minimum,
+            "max": maximum,
         }
     
     def get_all_metrics(self) -> dict[str, Any]:
@@ -7,7 +7,10 @@ Contains reusable services for the AI system.
 
 from app.services.translation import (
     detect_language,
+    detect_languages_batch,
+    get_conversation_language,
     translate,
+    translate_batch,
     translate_for_customer,
     detect_and_translate,
     LanguageResult,
@@ -17,7 +20,10 @@ from app.services.translation import (
 
 __all__ = [
     "detect_language",
+    "detect_languages_batch",
+    "get_conversation_language",
     "translate",
+    "translate_batch",
     "translate_for_customer",
     "detect_and_translate",
     "LanguageResult",
@@ -11,17 +11,20 @@
 # 4. Generates a draft invoice suggestion for review
 # =============================================================================
 
-import json
+import asyncio
+import logging
 import os
 import re
 import time
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from typing import Optional, Sequence
 
 import httpx
-from openai import OpenAI
+import orjson
 
+from app.integrations.openai_client import client
 from app.models.invoice_extraction import (
     ExtractedPart,
     ExtractedService,
@@ -35,7 +38,8 @@ from app.models.invoice_extraction import (
 # CONFIGURATION
 # =============================================================================
 
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+logger = logging.getLogger(__name__)
+
 CAMPOTECH_API_URL = os.getenv("CAMPOTECH_API_URL", "http://localhost:3000")
 CAMPOTECH_API_KEY = os.getenv("CAMPOTECH_SERVICE_KEY", "")
 
@@ -44,6 +48,19 @@ HIGH_CONFIDENCE_THRESHOLD = 0.85
 MEDIUM_CONFIDENCE_THRESHOLD = 0.70
 LOW_CONFIDENCE_THRESHOLD = 0.50
 
+# IVA rate applied to invoice suggestions (constructed once, not per invoice)
+_TAX_RATE = Decimal("0.21")
+
+# Matching normalization (compiled/built once - this runs for every
+# extracted item x pricebook entry pair)
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+_STOPWORDS = frozenset({'de', 'la', 'el', 'un', 'una', 'para', 'con', 'por', 'y', 'en'})
+
+# Catalogs above this size are pre-filtered through the trigram index
+# instead of being scored linearly
+_TRIGRAM_MIN_CATALOG = 50
+_TRIGRAM_TOP_K = 20
+
 
 # =============================================================================
 # EXTRACTION PROMPT
@@ -85,34 +102,242 @@ Tu tarea es analizar la transcripción de un reporte de voz de un técnico y ext
 Responde SOLO con JSON válido siguiendo el schema proporcionado."""
 
 
-EXTRACTION_USER_PROMPT = """Analiza este reporte de voz de un técnico y extrae la información:
+# Static instructions first, dynamic fields last: together with the fixed
+# system prompt this keeps the token prefix byte-identical across calls, so
+# OpenAI's automatic prompt cache can skip re-prefilling it
+EXTRACTION_USER_PROMPT = """Analiza este reporte de voz de un técnico y extrae la información.
 
-TRANSCRIPCIÓN:
-{transcription}
+Extrae:
+1. Resumen del trabajo (js)
+2. Trabajo realizado detallado (wp)
+3. Lista de partes/materiales usados (pu) con cantidades
+4. Lista de servicios realizados (sp)
+5. Tiempo trabajado si se menciona (at, dt, lh)
+6. Estado final del equipo (es)
+7. Si requiere seguimiento (fu)
+8. Si menciona fotos o firma (ph, sg)
+
+Respondé con el JSON estructurado (claves abreviadas).
 
 CONTEXTO DEL TRABAJO:
 - Tipo de servicio: {service_type}
 - Equipo: {equipment_info}
 
-Extrae:
-1. Resumen del trabajo (job_summary)
-2. Trabajo realizado detallado (work_performed)
-3. Lista de partes/materiales usados (parts_used) con cantidades
-4. Lista de servicios realizados (services_performed)
-5. Tiempo trabajado si se menciona
-6. Estado final del equipo (equipment_status)
-7. Si requiere seguimiento (follow_up_required)
-8. Si menciona fotos o firma
+TRANSCRIPCIÓN:
+{transcription}"""
+
+
+# Structured-output schema with short key codes: constrained decoding
+# guarantees parseable JSON on the first try, and the two-letter codes keep
+# repeated key overhead out of every emitted parts/services object
+EXTRACTION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "technician_report",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "js": {"type": ["string", "null"], "description": "resumen breve del trabajo"},
+                "wp": {"type": ["string", "null"], "description": "trabajo realizado detallado"},
+                "pu": {
+                    "type": "array",
+                    "description": "partes/materiales usados",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "n": {"type": "string", "description": "nombre de la parte/material"},
+                            "q": {"type": "number", "description": "cantidad"},
+                            "u": {"type": "string", "description": "unidad, metro, kg, etc."},
+                            "st": {"type": "string", "description": "texto original que la menciona"},
+                        },
+                        "required": ["n", "q", "u", "st"],
+                        "additionalProperties": False,
+                    },
+                },
+                "sp": {
+                    "type": "array",
+                    "description": "servicios realizados",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "d": {"type": "string", "description": "que se hizo"},
+                            "dm": {"type": ["number", "null"], "description": "duracion en minutos"},
+                            "t": {"type": ["string", "null"], "description": "diagnostico, reparacion, instalacion, etc."},
+                            "st": {"type": "string", "description": "texto original"},
+                        },
+                        "required": ["d", "dm", "t", "st"],
+                        "additionalProperties": False,
+                    },
+                },
+                "at": {"type": ["string", "null"], "description": "hora de llegada, ej '9:30'"},
+                "dt": {"type": ["string", "null"], "description": "hora de salida"},
+                "lh": {"type": ["number", "null"], "description": "total de horas trabajadas"},
+                "es": {"type": ["string", "null"], "description": "funcionando, requiere_seguimiento, no_reparable"},
+                "rc": {"type": ["string", "null"], "description": "recomendaciones"},
+                "fu": {"type": "boolean", "description": "requiere seguimiento"},
+                "fn": {"type": ["string", "null"], "description": "notas de seguimiento"},
+                "ph": {"type": "boolean", "description": "menciona fotos"},
+                "sg": {"type": "boolean", "description": "firma obtenida"},
+            },
+            "required": ["js", "wp", "pu", "sp", "at", "dt", "lh", "es", "rc", "fu", "fn", "ph", "sg"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# Short code -> canonical field name, applied after parsing the response
+_FIELD_MAP = {
+    "js": "job_summary",
+    "wp": "work_performed",
+    "pu": "parts_used",
+    "sp": "services_performed",
+    "at": "arrival_time",
+    "dt": "departure_time",
+    "lh": "total_labor_hours",
+    "es": "equipment_status",
+    "rc": "recommendations",
+    "fu": "follow_up_required",
+    "fn": "follow_up_notes",
+    "ph": "photos_mentioned",
+    "sg": "signature_obtained",
+}
+
+_PART_FIELD_MAP = {"n": "name", "q": "quantity", "u": "unit", "st": "source_text"}
+_SERVICE_FIELD_MAP = {"d": "description", "dm": "duration_minutes", "t": "service_type", "st": "source_text"}
+
+
+class _StreamingItemScanner:
+    """
+    Incrementally detect completed objects in the streamed "pu"/"sp" arrays.
+
+    The strict extraction schema nests objects exactly one level deep inside
+    those two arrays, so a string-aware brace counter is enough to slice out
+    each item as soon as its closing brace arrives - matching can then start
+    while the rest of the response is still streaming.
+    """
 
-Responde en JSON siguiendo este schema exacto:
-{schema}"""
+    _ARRAY_KEYS = {"pu": "part", "sp": "service"}
+
+    def __init__(self) -> None:
+        self.text = ""
+        self._pos = 0
+        self._in_string = False
+        self._escape = False
+        self._depth = 0
+        self._str_start = -1
+        self._last_key = ""
+        self._pending_array: Optional[str] = None
+        self._array: Optional[str] = None
+        self._item_start = -1
+
+    def feed(self, delta: str) -> list[tuple[str, dict]]:
+        """Consume a stream delta; return ("part"/"service", item) tuples completed by it."""
+        self.text += delta
+        buf = self.text
+        items: list[tuple[str, dict]] = []
+        i = self._pos
+
+        while i < len(buf):
+            c = buf[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_key = buf[self._str_start + 1:i]
+                i += 1
+                continue
+
+            if self._pending_array and not c.isspace() and c != "[":
+                self._pending_array = None  # key's value was not an array
+
+            if c == '"':
+                self._in_string = True
+                self._str_start = i
+            elif c == "{":
+                self._depth += 1
+                if self._array and self._depth == 2 and self._item_start < 0:
+                    self._item_start = i
+            elif c == "}":
+                if self._array and self._depth == 2 and self._item_start >= 0:
+                    try:
+                        items.append((self._array, orjson.loads(buf[self._item_start:i + 1])))
+                    except ValueError:
+                        pass
+                    self._item_start = -1
+                self._depth -= 1
+            elif c == ":":
+                if self._depth == 1 and self._last_key in self._ARRAY_KEYS:
+                    self._pending_array = self._ARRAY_KEYS[self._last_key]
+            elif c == "[":
+                if self._depth == 1 and self._pending_array:
+                    self._array = self._pending_array
+                    self._pending_array = None
+            elif c == "]":
+                if self._array and self._depth == 1:
+                    self._array = None
+            i += 1
+
+        self._pos = i
+        return items
+
+
+def _expand_extraction_keys(raw: dict) -> dict:
+    """Map the compact response keys back to canonical field names."""
+    expanded = {_FIELD_MAP.get(k, k): v for k, v in raw.items()}
+    expanded["parts_used"] = [
+        {_PART_FIELD_MAP.get(k, k): v for k, v in p.items()}
+        for p in expanded.get("parts_used", []) or []
+    ]
+    expanded["services_performed"] = [
+        {_SERVICE_FIELD_MAP.get(k, k): v for k, v in s.items()}
+        for s in expanded.get("services_performed", []) or []
+    ]
+    return expanded
 
 
 # =============================================================================
 # PRICEBOOK MATCHING
 # =============================================================================
 
-async def fetch_pricebook(organization_id: str) -> Sequence[dict]:
+@dataclass(frozen=True, slots=True)
+class PriceItem:
+    """
+    One pricebook row.
+
+    Slotted attribute access is noticeably cheaper than dict key lookups in
+    the matching and line-building loops, and coercing price once at load
+    time removes per-use conversion and failure handling.
+    """
+    id: str
+    name: str
+    description: str
+    unit: str
+    price: float
+    type: str
+
+
+def _price_item_from_raw(raw: dict) -> PriceItem:
+    """Coerce one raw API pricebook entry into a PriceItem."""
+    try:
+        price = float(raw.get("price") or 0)
+    except (TypeError, ValueError):
+        price = 0.0
+    return PriceItem(
+        id=str(raw.get("id") or ""),
+        name=raw.get("name") or "",
+        description=raw.get("description") or "",
+        unit=raw.get("unit") or "",
+        price=price,
+        type=raw.get("type") or "",
+    )
+
+
+async def fetch_pricebook(organization_id: str) -> list[PriceItem]:
     """Fetch the organization's pricebook from CampoTech API."""
     try:
         async with httpx.AsyncClient() as client:
@@ -124,105 +349,240 @@ async def fetch_pricebook(organization_id: str) -> Sequence[dict]:
                 },
                 timeout=10.0,
             )
-            
+
             if response.status_code == 200:
                 data = response.json()
-                return data.get("items", [])
-            
+                return [_price_item_from_raw(item) for item in data.get("items", [])]
+
             return []
-    except Exception as e:
-        print(f"Error fetching pricebook: {e}")
+    except Exception:
+        logger.exception("Error fetching pricebook for organization %s", organization_id)
         return []
 
 
+def _normalize_tokens(s: str) -> set[str]:
+    """Normalize a name into a set of significant lowercase tokens."""
+    tokens = _NON_WORD_RE.sub('', s.lower()).split()
+    return {t for t in tokens if t not in _STOPWORDS and len(t) > 2}
+
+
+def _trigrams(tokens: set[str]) -> set[str]:
+    """Character 3-grams of each token (short tokens index as themselves)."""
+    grams: set[str] = set()
+    for token in tokens:
+        if len(token) < 3:
+            grams.add(token)
+        else:
+            for i in range(len(token) - 2):
+                grams.add(token[i:i + 3])
+    return grams
+
+
+def _score_tokens(query_tokens: set[str], catalog_tokens: set[str]) -> float:
+    """Jaccard similarity between two pre-normalized token sets."""
+    if not query_tokens or not catalog_tokens:
+        return 0.0
+
+    intersection = len(query_tokens & catalog_tokens)
+    union = len(query_tokens | catalog_tokens)
+
+    return intersection / union if union > 0 else 0.0
+
+
 def calculate_match_score(extracted_name: str, catalog_name: str) -> float:
     """
     Calculate similarity score between extracted item and catalog item.
     Uses simple token matching - can be enhanced with embeddings later.
     """
-    # Normalize both strings
-    def normalize(s: str) -> set[str]:
-        s = s.lower()
-        s = re.sub(r'[^\w\s]', '', s)
-        tokens = s.split()
-        # Remove common stopwords
-        stopwords = {'de', 'la', 'el', 'un', 'una', 'para', 'con', 'por', 'y', 'en'}
-        return {t for t in tokens if t not in stopwords and len(t) > 2}
-    
-    extracted_tokens = normalize(extracted_name)
-    catalog_tokens = normalize(catalog_name)
-    
-    if not extracted_tokens or not catalog_tokens:
-        return 0.0
-    
-    # Jaccard similarity
-    intersection = len(extracted_tokens & catalog_tokens)
-    union = len(extracted_tokens | catalog_tokens)
-    
-    return intersection / union if union > 0 else 0.0
+    return _score_tokens(_normalize_tokens(extracted_name), _normalize_tokens(catalog_name))
+
+
+class PricebookIndex:
+    """
+    Pricebook preprocessed for repeated matching.
+
+    Normalizing every item's name and description happens exactly once here,
+    so matching K extracted items against M catalog entries tokenizes the
+    catalog once instead of K times.
+    """
+
+    def __init__(self, items: "Sequence[PriceItem | dict]") -> None:
+        self.items: list[PriceItem] = [
+            item if isinstance(item, PriceItem) else _price_item_from_raw(item)
+            for item in items
+        ]
+        self.name_tokens = [_normalize_tokens(item.name) for item in self.items]
+        self.desc_tokens = [_normalize_tokens(item.description) for item in self.items]
+        self.units = [item.unit.lower() for item in self.items]
+
+        # Item ids partitioned by type once at build time, so per-query
+        # matching never rescans the catalog just to filter on type
+        self.part_ids = [i for i, item in enumerate(self.items) if item.type == "PRODUCT"]
+        self.service_ids = [i for i, item in enumerate(self.items) if item.type == "SERVICE"]
+
+        # Normalized name -> item id for O(1) exact hits (technicians often
+        # say the catalog name verbatim); first item wins on collisions
+        self.exact_index: dict[str, int] = {}
+        for i, tokens in enumerate(self.name_tokens):
+            key = " ".join(sorted(tokens))
+            if key and key not in self.exact_index:
+                self.exact_index[key] = i
+
+        # Trigram -> item ids inverted index, for sub-linear candidate
+        # selection on large catalogs
+        self.trigram_index: dict[str, set[int]] = {}
+        for i in range(len(self.items)):
+            for trigram in _trigrams(self.name_tokens[i] | self.desc_tokens[i]):
+                self.trigram_index.setdefault(trigram, set()).add(i)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def trigram_candidates(self, query_tokens: set[str], limit: int = _TRIGRAM_TOP_K) -> list[int]:
+        """
+        Item ids sharing at least two trigrams with the query, best first.
+
+        Intersecting postings replaces the O(catalog) fuzzy scan with a few
+        dict lookups; the fuzzy scorer then only runs on the survivors.
+        """
+        shared: dict[int, int] = {}
+        for trigram in _trigrams(query_tokens):
+            for item_id in self.trigram_index.get(trigram, ()):
+                shared[item_id] = shared.get(item_id, 0) + 1
+
+        candidates = [item_id for item_id, count in shared.items() if count >= 2]
+        candidates.sort(key=lambda item_id: shared[item_id], reverse=True)
+        return candidates[:limit]
 
 
 def match_to_pricebook(
     extracted_name: str,
     extracted_unit: str,
-    pricebook: Sequence[dict],
+    pricebook: "PricebookIndex | Sequence[PriceItem | dict]",
     item_type: str = "any"
-) -> tuple[Optional[dict], float, list[dict]]:
+) -> tuple[Optional[PriceItem], float, list[dict]]:
     """
     Match an extracted item to the pricebook.
-    
+
+    Accepts a prebuilt PricebookIndex (preferred when matching several items
+    against the same catalog) or a raw item list, which is indexed ad hoc.
+
     Returns:
     - best_match: Best matching PriceItem or None
     - confidence: Match confidence score
-    - alternatives: List of alternative matches with scores
+    - alternatives: Up to 3 alternative matches as dicts with scores
     """
+    if not isinstance(pricebook, PricebookIndex):
+        pricebook = PricebookIndex(pricebook)
+
     if not pricebook:
         return None, 0.0, []
-    
-    # Filter by type if specified
+
+    # Use the type partition built at index time; an empty partition falls
+    # back to the whole catalog rather than matching nothing
     if item_type == "part":
-        candidates = [p for p in pricebook if p.get("type") == "PRODUCT"]
+        candidate_ids = pricebook.part_ids
     elif item_type == "service":
-        candidates = [p for p in pricebook if p.get("type") == "SERVICE"]
+        candidate_ids = pricebook.service_ids
     else:
-        candidates = pricebook
-    
-    if not candidates:
-        candidates = pricebook
-    
-    # Score all candidates
+        candidate_ids = None
+
+    if not candidate_ids:
+        candidate_ids = list(range(len(pricebook)))
+
+    query_tokens = _normalize_tokens(extracted_name)
+    if not query_tokens:
+        # Nothing to score against - unit bonus alone never clears the
+        # 0.2 threshold below
+        return None, 0.0, []
+
+    # Exact normalized-name hit: a dict lookup beats any fuzzy scan by
+    # orders of magnitude, and an exact name needs no alternatives
+    exact_id = pricebook.exact_index.get(" ".join(sorted(query_tokens)))
+    if exact_id is not None:
+        exact = pricebook.items[exact_id]
+        if (
+            item_type == "any"
+            or (item_type == "part" and exact.type == "PRODUCT")
+            or (item_type == "service" and exact.type == "SERVICE")
+        ):
+            return exact, 1.0, []
+
+    extracted_unit = extracted_unit.lower()
+
+    # On large catalogs, narrow to items sharing trigrams with the query
+    # before fuzzy-scoring; small catalogs are cheap enough to scan whole
+    if len(candidate_ids) > _TRIGRAM_MIN_CATALOG:
+        narrowed = set(pricebook.trigram_candidates(query_tokens)) & set(candidate_ids)
+        if narrowed:
+            candidate_ids = sorted(narrowed)
+
+    # Score all candidates. The Jaccard math is inlined with everything
+    # bound to locals: this loop runs catalog-size times per extracted item
+    # and attribute/function lookups dominate it otherwise.
+    items = pricebook.items
+    name_tokens = pricebook.name_tokens
+    desc_tokens = pricebook.desc_tokens
+    units = pricebook.units
+    query_len = len(query_tokens)
+
     scored = []
-    for item in candidates:
-        name = item.get("name", "")
-        description = item.get("description", "")
-        
-        # Calculate score considering both name and description
-        name_score = calculate_match_score(extracted_name, name)
-        desc_score = calculate_match_score(extracted_name, description) * 0.7
-        
+    for i in candidate_ids:
+        cand_name = name_tokens[i]
+        shared = len(query_tokens & cand_name)
+        name_score = shared / (query_len + len(cand_name) - shared) if shared else 0.0
+
+        cand_desc = desc_tokens[i]
+        if cand_desc:
+            shared = len(query_tokens & cand_desc)
+            desc_score = (
+                shared / (query_len + len(cand_desc) - shared) * 0.7 if shared else 0.0
+            )
+        else:
+            desc_score = 0.0
+
         # Bonus for unit match
-        unit_bonus = 0.1 if item.get("unit", "").lower() == extracted_unit.lower() else 0
-        
+        unit_bonus = 0.1 if units[i] == extracted_unit else 0
+
         total_score = min(1.0, max(name_score, desc_score) + unit_bonus)
-        
+
         if total_score > 0.2:
-            scored.append({
-                "id": item.get("id"),
-                "name": name,
-                "price": item.get("price"),
-                "unit": item.get("unit"),
-                "type": item.get("type"),
-                "score": total_score,
-            })
-    
-    # Sort by score
-    scored.sort(key=lambda x: x["score"], reverse=True)
-    
-    best_match = scored[0] if scored else None
-    best_confidence = best_match["score"] if best_match else 0.0
-    alternatives = scored[1:4] if len(scored) > 1 else []  # Top 3 alternatives
-    
-    return best_match, best_confidence, alternatives
+            scored.append((total_score, i))
+
+    # Sort by score; dicts for the API payload are only built for the few
+    # alternatives that survive
+    scored.sort(key=lambda x: x[0], reverse=True)
+
+    if not scored:
+        return None, 0.0, []
+
+    best_confidence, best_id = scored[0]
+    alternatives = [
+        {
+            "id": items[i].id,
+            "name": items[i].name,
+            "price": items[i].price,
+            "unit": items[i].unit,
+            "type": items[i].type,
+            "score": score,
+        }
+        for score, i in scored[1:4]
+    ]
+
+    return items[best_id], best_confidence, alternatives
+
+
+def _line_amounts(price: object, quantity: float) -> tuple[Decimal, Decimal]:
+    """
+    Compute (unit_price, total) for a line item.
+
+    Money math runs in integer cents - int multiplication is orders of
+    magnitude cheaper than Decimal.__mul__ - and converts to Decimal
+    exactly once per amount when building the response model.
+    """
+    unit_cents = round(float(price or 0) * 100)
+    total_cents = round(unit_cents * quantity)
+    return Decimal(unit_cents).scaleb(-2), Decimal(total_cents).scaleb(-2)
 
 
 # =============================================================================
@@ -245,63 +605,67 @@ async def extract_invoice_data(
     4. Generates invoice suggestion with calculated totals
     """
     start_time = time.time()
-    
-    # Initialize OpenAI
-    client = OpenAI(api_key=OPENAI_API_KEY)
-    
-    # Define the expected schema
-    schema = {
-        "job_summary": "string - brief summary",
-        "work_performed": "string - detailed work description",
-        "parts_used": [
-            {
-                "name": "string - part name",
-                "quantity": "number - how many",
-                "unit": "string - unidad, metro, kg, etc.",
-                "source_text": "string - original text mentioning this"
-            }
-        ],
-        "services_performed": [
-            {
-                "description": "string - what was done",
-                "duration_minutes": "number or null",
-                "service_type": "string - diagnostico, reparacion, instalacion, etc.",
-                "source_text": "string"
-            }
-        ],
-        "arrival_time": "string or null - e.g. '9:30'",
-        "departure_time": "string or null",
-        "total_labor_hours": "number or null",
-        "equipment_status": "string - funcionando, requiere_seguimiento, no_reparable",
-        "recommendations": "string or null",
-        "follow_up_required": "boolean",
-        "follow_up_notes": "string or null",
-        "photos_mentioned": "boolean",
-        "signature_obtained": "boolean"
-    }
-    
-    # Call GPT-4 for extraction
+
+    async def _load_pricebook_index() -> PricebookIndex:
+        return PricebookIndex(await fetch_pricebook(organization_id))
+
+    # Start fetching the pricebook right away - it is independent of the
+    # extraction call, so its latency (and the one-time index build) hides
+    # behind the LLM round-trip
+    pricebook_task = asyncio.create_task(_load_pricebook_index())
+
+    async def _match_when_ready(name: str, unit: str, item_type: str):
+        """Match one streamed item as soon as the pricebook is available."""
+        catalog = await pricebook_task
+        return await asyncio.to_thread(match_to_pricebook, name, unit, catalog, item_type)
+
+    # Stream the extraction and dispatch pricebook matching for each part or
+    # service as soon as its object completes, instead of waiting for the
+    # full response - matching leaves the critical path entirely
+    scanner = _StreamingItemScanner()
+    early_part_tasks: list[asyncio.Task] = []
+    early_service_tasks: list[asyncio.Task] = []
+
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            response_format={"type": "json_object"},
+        stream = await client.chat.completions.create(
+            model="gpt-4o-mini",
+            response_format=EXTRACTION_RESPONSE_FORMAT,
             messages=[
                 {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
                 {"role": "user", "content": EXTRACTION_USER_PROMPT.format(
                     transcription=transcription,
                     service_type=service_type or "No especificado",
                     equipment_info=equipment_info or "No especificado",
-                    schema=json.dumps(schema, ensure_ascii=False, indent=2),
                 )}
             ],
-            temperature=0.1,
-            max_tokens=2000,
+            temperature=0,
+            seed=42,
+            max_tokens=800,
+            stream=True,
         )
-        
-        extracted_json = json.loads(response.choices[0].message.content)
-    except Exception as e:
-        print(f"Extraction error: {e}")
+
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if not delta:
+                continue
+            for kind, item in scanner.feed(delta):
+                if kind == "part":
+                    early_part_tasks.append(asyncio.create_task(
+                        _match_when_ready(item.get("n", ""), item.get("u", "unidad"), "part")
+                    ))
+                else:
+                    early_service_tasks.append(asyncio.create_task(
+                        _match_when_ready(item.get("d", ""), "hora", "service")
+                    ))
+
+        extracted_json = _expand_extraction_keys(orjson.loads(scanner.text))
+    except Exception:
+        logger.exception("Extraction error")
         extracted_json = {}
+        for task in early_part_tasks + early_service_tasks:
+            task.cancel()
+        early_part_tasks = []
+        early_service_tasks = []
     
     # Parse into our models
     parts = [
@@ -343,58 +707,65 @@ async def extract_invoice_data(
         overall_confidence=0.8,
     )
     
-    # Fetch pricebook and match items
-    pricebook = await fetch_pricebook(organization_id)
+    # Collect the pricebook fetched concurrently with the extraction call
+    pricebook = await pricebook_task
     
     line_items: list[MatchedLineItem] = []
     review_notes: list[str] = []
     
-    # Match parts to pricebook
-    for part in parts:
-        match, confidence, alternatives = match_to_pricebook(
-            part.name, part.unit, pricebook, item_type="part"
-        )
-        
+    # Match parts to pricebook - normally the matches were already dispatched
+    # while the response streamed; fall back to a fresh parallel batch if the
+    # streamed items do not line up with the parsed extraction
+    if len(early_part_tasks) == len(parts):
+        part_matches = await asyncio.gather(*early_part_tasks)
+    else:
+        for task in early_part_tasks:
+            task.cancel()
+        part_matches = await asyncio.gather(*[
+            asyncio.to_thread(match_to_pricebook, part.name, part.unit, pricebook, "part")
+            for part in parts
+        ])
+
+    for part, (match, confidence, alternatives) in zip(parts, part_matches):
+
         if match and confidence >= HIGH_CONFIDENCE_THRESHOLD:
             # High confidence match
-            unit_price = Decimal(str(match.get("price", 0)))
-            total = unit_price * Decimal(str(part.quantity))
+            unit_price, total = _line_amounts(match.price, part.quantity)
             
             line_items.append(MatchedLineItem(
-                description=match["name"],
+                description=match.name,
                 quantity=part.quantity,
-                unit=match.get("unit", part.unit),
+                unit=match.unit or part.unit,
                 unit_price=unit_price,
                 total=total,
                 source_type="part",
                 source_text=part.source_text,
-                matched_price_item_id=match["id"],
-                matched_price_item_name=match["name"],
+                matched_price_item_id=match.id,
+                matched_price_item_name=match.name,
                 match_confidence=confidence,
                 alternative_matches=alternatives,
                 needs_review=False,
             ))
         elif match and confidence >= MEDIUM_CONFIDENCE_THRESHOLD:
             # Medium confidence - needs review
-            unit_price = Decimal(str(match.get("price", 0)))
-            total = unit_price * Decimal(str(part.quantity))
+            unit_price, total = _line_amounts(match.price, part.quantity)
             
             line_items.append(MatchedLineItem(
-                description=match["name"],
+                description=match.name,
                 quantity=part.quantity,
-                unit=match.get("unit", part.unit),
+                unit=match.unit or part.unit,
                 unit_price=unit_price,
                 total=total,
                 source_type="part",
                 source_text=part.source_text,
-                matched_price_item_id=match["id"],
-                matched_price_item_name=match["name"],
+                matched_price_item_id=match.id,
+                matched_price_item_name=match.name,
                 match_confidence=confidence,
                 alternative_matches=alternatives,
                 needs_review=True,
-                review_reason=f"Coincidencia media ({int(confidence*100)}%): '{part.name}' → '{match['name']}'",
+                review_reason=f"Coincidencia media ({int(confidence*100)}%): '{part.name}' → '{match.name}'",
             ))
-            review_notes.append(f"Revisar: '{part.name}' coincide parcialmente con '{match['name']}'")
+            review_notes.append(f"Revisar: '{part.name}' coincide parcialmente con '{match.name}'")
         else:
             # Low/no confidence - custom item, needs pricing
             line_items.append(MatchedLineItem(
@@ -414,29 +785,34 @@ async def extract_invoice_data(
             ))
             review_notes.append(f"Agregá precio para: '{part.name}'")
     
-    # Match services to pricebook
-    for service in services:
-        match, confidence, alternatives = match_to_pricebook(
-            service.description, "hora", pricebook, item_type="service"
-        )
-        
+    # Match services to pricebook - same early-dispatch scheme as the parts
+    if len(early_service_tasks) == len(services):
+        service_matches = await asyncio.gather(*early_service_tasks)
+    else:
+        for task in early_service_tasks:
+            task.cancel()
+        service_matches = await asyncio.gather(*[
+            asyncio.to_thread(match_to_pricebook, service.description, "hora", pricebook, "service")
+            for service in services
+        ])
+
+    for service, (match, confidence, alternatives) in zip(services, service_matches):
         # Calculate hours from duration
         hours = service.duration_minutes / 60 if service.duration_minutes else 1.0
         
         if match and confidence >= MEDIUM_CONFIDENCE_THRESHOLD:
-            unit_price = Decimal(str(match.get("price", 0)))
-            total = unit_price * Decimal(str(hours))
+            unit_price, total = _line_amounts(match.price, hours)
             
             line_items.append(MatchedLineItem(
-                description=match["name"],
+                description=match.name,
                 quantity=hours,
-                unit=match.get("unit", "hora"),
+                unit=match.unit or "hora",
                 unit_price=unit_price,
                 total=total,
                 source_type="service",
                 source_text=service.source_text,
-                matched_price_item_id=match["id"],
-                matched_price_item_name=match["name"],
+                matched_price_item_id=match.id,
+                matched_price_item_name=match.name,
                 match_confidence=confidence,
                 alternative_matches=alternatives,
                 needs_review=confidence < HIGH_CONFIDENCE_THRESHOLD,
@@ -461,22 +837,24 @@ async def extract_invoice_data(
             ))
             review_notes.append(f"Agregá precio para servicio: '{service.description}'")
     
-    # Calculate totals (only for priced items)
-    subtotal = sum(
-        item.total for item in line_items 
-        if item.total is not None
-    )
-    tax_rate = Decimal("21.0") / Decimal("100")
-    tax_amount = subtotal * tax_rate
+    # Totals, confidence and review status in a single pass over line items
+    subtotal = Decimal("0")
+    confidence_sum = 0.0
+    priced_count = 0
+    requires_review = False
+    for item in line_items:
+        if item.total is not None:
+            subtotal += item.total
+        if item.unit_price is not None:
+            confidence_sum += item.match_confidence
+            priced_count += 1
+        if item.needs_review:
+            requires_review = True
+
+    tax_amount = subtotal * _TAX_RATE
     total = subtotal + tax_amount
-    
-    # Calculate overall confidence
-    priced_items = [i for i in line_items if i.unit_price is not None]
-    overall_confidence = (
-        sum(i.match_confidence for i in priced_items) / len(priced_items)
-        if priced_items else 0.0
-    )
-    
+    overall_confidence = confidence_sum / priced_count if priced_count else 0.0
+
     processing_time = int((time.time() - start_time) * 1000)
     
     return InvoiceSuggestion(
@@ -490,7 +868,7 @@ async def extract_invoice_data(
         transcription=transcription,
         processing_duration_ms=processing_time,
         generated_at=datetime.now().isoformat(),
-        requires_review=any(item.needs_review for item in line_items),
+        requires_review=requires_review,
         review_notes=review_notes,
         overall_match_confidence=overall_confidence,
     )
@@ -13,10 +13,61 @@ Features:
 - Support for technical terms and brand names preservation
 """
 
+import hashlib
+import logging
+from collections import OrderedDict
+from contextvars import ContextVar
 from typing import Optional
+
+import orjson
 from pydantic import BaseModel
+
 from app.integrations.openai_client import client
 
+logger = logging.getLogger(__name__)
+
+
+# In-process LRU caches for detection/translation results. Customer chats
+# repeat the same short messages constantly; a hit skips the LLM round-trip.
+_CACHE_MAX_ENTRIES = 10_000
+_detection_cache: OrderedDict[bytes, "LanguageResult"] = OrderedDict()
+_translation_cache: OrderedDict[tuple[str, str, bytes], str] = OrderedDict()
+
+
+# Detected language per conversation, scoped to the current task context.
+# Once detect_and_translate has classified a customer, later replies in the
+# same request flow reuse the code instead of re-detecting.
+_conversation_languages: ContextVar[Optional[dict[str, str]]] = ContextVar(
+    "conversation_languages", default=None
+)
+
+
+def _conv_langs() -> dict[str, str]:
+    """The current context's conversation -> language map, created lazily."""
+    langs = _conversation_languages.get()
+    if langs is None:
+        langs = {}
+        _conversation_languages.set(langs)
+    return langs
+
+
+def get_conversation_language(conversation_id: str) -> Optional[str]:
+    """Language code remembered for a conversation, if any."""
+    return _conv_langs().get(conversation_id)
+
+
+def _text_key(text: str) -> bytes:
+    """Stable, compact cache key for a piece of text."""
+    return hashlib.blake2b(text.strip().lower().encode(), digest_size=16).digest()
+
+
+def _cache_put(cache: OrderedDict, key, value) -> None:
+    """Insert into an LRU cache, evicting the oldest entry when full."""
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > _CACHE_MAX_ENTRIES:
+        cache.popitem(last=False)
+
 
 class LanguageResult(BaseModel):
     """Result of language detection."""
@@ -49,6 +100,93 @@ SUPPORTED_LANGUAGES = {
 }
 
 
+# Distinctive high-frequency words per language, used to classify obvious
+# inputs without an LLM call. Words shared between Spanish and Portuguese
+# ("de", "que", "para"...) are deliberately left out so they cannot inflate
+# both counts at once.
+_ES_STOPWORDS = frozenset({
+    "el", "la", "los", "las", "una", "es", "está", "están", "y", "en",
+    "con", "no", "se", "del", "al", "pero", "más", "este", "esta", "eso",
+    "hay", "tengo", "hola", "gracias", "cuando", "donde", "porque", "muy",
+    "también", "hacer", "necesito", "quiero", "bueno", "mañana",
+})
+_EN_STOPWORDS = frozenset({
+    "the", "a", "an", "of", "in", "and", "is", "are", "to", "for", "with",
+    "not", "it", "that", "this", "on", "at", "have", "has", "you", "my",
+    "please", "thanks", "hello", "when", "where", "because", "very", "need",
+    "want", "good", "tomorrow",
+})
+_PT_STOPWORDS = frozenset({
+    "o", "os", "as", "um", "uma", "é", "em", "e", "com", "não", "se",
+    "do", "da", "dos", "das", "mas", "mais", "esse", "essa", "isso", "tem",
+    "tenho", "olá", "obrigado", "obrigada", "quando", "onde", "muito",
+    "também", "fazer", "preciso", "quero", "bom", "amanhã", "você",
+})
+
+# Codepoint ranges whose presence means the text is not ES/EN/PT - those
+# inputs skip the heuristic and go straight to the LLM
+_NON_LATIN_RANGES = (
+    (0x0400, 0x04FF),   # Cyrillic
+    (0x0590, 0x05FF),   # Hebrew
+    (0x0600, 0x06FF),   # Arabic
+    (0x3040, 0x30FF),   # Hiragana/Katakana
+    (0x4E00, 0x9FFF),   # CJK unified ideographs
+    (0xAC00, 0xD7AF),   # Hangul
+)
+
+
+def _detect_language_heuristic(text: str) -> Optional[LanguageResult]:
+    """
+    Classify obvious Spanish/English/Portuguese inputs without the LLM.
+
+    Counts distinctive stopwords per language; when one language clearly
+    dominates and no non-Latin script is present, the answer is confident
+    enough to skip the model round-trip. Returns None when unsure.
+    """
+    for char in text:
+        code = ord(char)
+        if code > 0x3FF and any(lo <= code <= hi for lo, hi in _NON_LATIN_RANGES):
+            return None
+
+    tokens = text.lower().split()
+    es_hits = sum(1 for t in tokens if t in _ES_STOPWORDS)
+    en_hits = sum(1 for t in tokens if t in _EN_STOPWORDS)
+    pt_hits = sum(1 for t in tokens if t in _PT_STOPWORDS)
+    total = es_hits + en_hits + pt_hits
+    if total < 2:
+        return None
+
+    for hits, code, name in (
+        (es_hits, "es", "Español"),
+        (en_hits, "en", "English"),
+        (pt_hits, "pt", "Português"),
+    ):
+        if hits / total > 0.6:
+            return LanguageResult(code=code, name=name, confidence=0.9)
+    return None
+
+
+# Static system prompt: the language pair and per-call options live in the
+# user message so this prefix stays byte-identical across calls and OpenAI's
+# automatic prompt cache can reuse the prefilled tokens
+TRANSLATION_SYSTEM_PROMPT = """You are a professional translator for a field service company in Argentina.
+The user message states the source and target language, then the text to translate.
+
+When translating TO Spanish, use Argentine dialect:
+- Use "vos" instead of "tú" (e.g., "vos querés" not "tú quieres")
+- Use "che" and other Rioplatense expressions naturally
+- Use "bacha" not "lavabo", "canilla" not "grifo", "pileta" not "piscina"
+- Use "heladera" not "refrigerador", "frazada" not "manta"
+- Use local HVAC terminology (aire acondicionado split, etc.)
+
+Rules:
+- Preserve technical terms, brand names, and model numbers
+- Keep proper nouns unchanged
+- Maintain the tone and formality of the original
+- For addresses and phone numbers, keep the original format
+- Return ONLY the translation, no explanations or notes"""
+
+
 async def detect_language(text: str) -> LanguageResult:
     """
     Detect the language of the given text using GPT-4o-mini.
@@ -62,7 +200,20 @@ async def detect_language(text: str) -> LanguageResult:
     if not text or len(text.strip()) < 3:
         # Default to Spanish for very short or empty texts
         return LanguageResult(code="es", name="Español", confidence=0.5)
-    
+
+    cache_key = _text_key(text)
+    cached = _detection_cache.get(cache_key)
+    if cached is not None:
+        _detection_cache.move_to_end(cache_key)
+        return cached
+
+    # Obvious inputs (the common-case Argentine Spanish message) resolve
+    # locally without paying the LLM round-trip
+    heuristic = _detect_language_heuristic(text)
+    if heuristic is not None:
+        _cache_put(_detection_cache, cache_key, heuristic)
+        return heuristic
+
     try:
         response = await client.chat.completions.create(
             model="gpt-4o-mini",
@@ -86,20 +237,97 @@ Return only valid JSON, no additional text."""
             ],
             response_format={"type": "json_object"},
             temperature=0,
+            seed=42,
             max_tokens=100,
         )
         
         result = LanguageResult.model_validate_json(
             response.choices[0].message.content or '{"code": "es", "name": "Español", "confidence": 0.5}'
         )
+        _cache_put(_detection_cache, cache_key, result)
         return result
-        
-    except Exception as e:
-        print(f"Language detection error: {e}")
+
+    except Exception:
+        logger.exception("Language detection error")
         # Default to Spanish on error
         return LanguageResult(code="es", name="Español", confidence=0.5)
 
 
+async def detect_languages_batch(texts: list[str]) -> list["LanguageResult"]:
+    """
+    Detect the language of several texts with a single GPT call.
+
+    Batching amortizes the per-call network and prompt overhead when a
+    burst of messages needs detection (e.g. bulk technician messages).
+    Cached or trivially-short texts are resolved locally; only the
+    remaining ones are sent to the LLM.
+
+    Args:
+        texts: The texts to analyze
+
+    Returns:
+        One LanguageResult per input text, in the same order
+    """
+    results: list[Optional[LanguageResult]] = [None] * len(texts)
+    pending: list[tuple[int, str]] = []
+
+    for i, text in enumerate(texts):
+        if not text or len(text.strip()) < 3:
+            results[i] = LanguageResult(code="es", name="Español", confidence=0.5)
+            continue
+        cached = _detection_cache.get(_text_key(text))
+        if cached is not None:
+            _detection_cache.move_to_end(_text_key(text))
+            results[i] = cached
+            continue
+        heuristic = _detect_language_heuristic(text)
+        if heuristic is not None:
+            _cache_put(_detection_cache, _text_key(text), heuristic)
+            results[i] = heuristic
+        else:
+            pending.append((i, text))
+
+    if pending:
+        try:
+            response = await client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": """You are a language detection system. You receive a JSON array of texts.
+For EACH text, in order, detect its language. Return JSON:
+{"results": [{"code": "...", "name": "...", "confidence": 0.0}, ...]}
+
+- "code": ISO 639-1 language code (e.g., "en", "es", "pt")
+- "name": Full language name in that language (e.g., "English", "Español")
+- "confidence": Your confidence level from 0.0 to 1.0
+
+The "results" array MUST have exactly one entry per input text, same order.
+Return only valid JSON, no additional text."""
+                    },
+                    {"role": "user", "content": orjson.dumps([t for _, t in pending]).decode()}
+                ],
+                response_format={"type": "json_object"},
+                temperature=0,
+                seed=42,
+                max_tokens=40 * len(pending) + 60,
+            )
+
+            parsed = orjson.loads(response.choices[0].message.content or "{}")
+            detected = parsed.get("results", [])
+
+            for (i, text), entry in zip(pending, detected):
+                result = LanguageResult.model_validate(entry)
+                _cache_put(_detection_cache, _text_key(text), result)
+                results[i] = result
+
+        except Exception:
+            logger.exception("Batch language detection error")
+
+    # Default any unresolved entries to Spanish (LLM failure or short reply)
+    return [r or LanguageResult(code="es", name="Español", confidence=0.5) for r in results]
+
+
 async def translate(
     text: str,
     source_lang: str,
@@ -118,89 +346,180 @@ async def translate(
     """
     if not text or source_lang == target_lang:
         return text
-    
+
+    cache_key = (source_lang, target_lang, _text_key(text))
+    cached = _translation_cache.get(cache_key)
+    if cached is not None:
+        _translation_cache.move_to_end(cache_key)
+        return cached
+
     # Get language names for context
     source_name = SUPPORTED_LANGUAGES.get(source_lang, source_lang)
     target_name = SUPPORTED_LANGUAGES.get(target_lang, target_lang)
-    
-    # Argentine Spanish specific instructions
-    spanish_instructions = ""
-    if target_lang == "es":
-        spanish_instructions = """
-When translating TO Spanish, use Argentine dialect:
-- Use "vos" instead of "tú" (e.g., "vos querés" not "tú quieres")
-- Use "che" and other Rioplatense expressions naturally
-- Use "bacha" not "lavabo", "canilla" not "grifo", "pileta" not "piscina"
-- Use "heladera" not "refrigerador", "frazada" not "manta"
-- Use local HVAC terminology (aire acondicionado split, etc.)
-"""
-    
+
     try:
         response = await client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
+                {"role": "system", "content": TRANSLATION_SYSTEM_PROMPT},
                 {
-                    "role": "system",
-                    "content": f"""You are a professional translator for a field service company in Argentina.
-Translate the following message from {source_name} to {target_name}.
-{spanish_instructions}
-Rules:
-- Preserve technical terms, brand names, and model numbers
-- Keep proper nouns unchanged
-- Maintain the tone and formality of the original
-- For addresses and phone numbers, keep the original format
-- Return ONLY the translation, no explanations or notes"""
+                    "role": "user",
+                    "content": f"Translate from {source_name} to {target_name}:\n\n{text}",
                 },
-                {"role": "user", "content": text}
             ],
-            temperature=0.3,
+            temperature=0,
+            seed=42,
             max_tokens=1000,
         )
         
-        return response.choices[0].message.content or text
-        
-    except Exception as e:
-        print(f"Translation error: {e}")
+        translated = response.choices[0].message.content or text
+        _cache_put(_translation_cache, cache_key, translated)
+        return translated
+
+    except Exception:
+        logger.exception("Translation error")
         return text  # Return original on error
 
 
+async def translate_batch(
+    texts: list[str],
+    source_lang: str,
+    target_lang: str = "es",
+) -> list[str]:
+    """
+    Translate several texts between the same language pair in one GPT call.
+
+    Bulk flows (batched notifications, grouped customer responses) would
+    otherwise pay a full model round-trip per message; a single call shares
+    the network overhead and system prompt across the whole batch.
+
+    Args:
+        texts: The texts to translate
+        source_lang: Source language ISO code
+        target_lang: Target language ISO code (default: "es" for Spanish)
+
+    Returns:
+        One translation per input text, in the same order
+    """
+    if source_lang == target_lang:
+        return list(texts)
+
+    results: list[Optional[str]] = [None] * len(texts)
+    pending: list[tuple[int, str]] = []
+
+    for i, text in enumerate(texts):
+        if not text:
+            results[i] = text
+            continue
+        cache_key = (source_lang, target_lang, _text_key(text))
+        cached = _translation_cache.get(cache_key)
+        if cached is not None:
+            _translation_cache.move_to_end(cache_key)
+            results[i] = cached
+        else:
+            pending.append((i, text))
+
+    if pending:
+        source_name = SUPPORTED_LANGUAGES.get(source_lang, source_lang)
+        target_name = SUPPORTED_LANGUAGES.get(target_lang, target_lang)
+
+        try:
+            response = await client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": """You are a professional translator for a field service company in Argentina.
+The user message states the source and target language, then a JSON array of messages.
+Translate EACH one.
+
+Rules:
+- Preserve technical terms, brand names, and model numbers
+- Keep proper nouns unchanged
+- Maintain the tone and formality of each original
+- For addresses and phone numbers, keep the original format
+- Return JSON: {"t": ["...", ...]} with exactly one translation per input, same order"""
+                    },
+                    {
+                        "role": "user",
+                        "content": (
+                            f"Translate from {source_name} to {target_name}:\n\n"
+                            + orjson.dumps([t for _, t in pending]).decode()
+                        ),
+                    },
+                ],
+                response_format={"type": "json_object"},
+                temperature=0,
+                seed=42,
+                max_tokens=1000,
+            )
+
+            parsed = orjson.loads(response.choices[0].message.content or "{}")
+            translated = parsed.get("t", [])
+
+            for (i, text), result in zip(pending, translated):
+                if isinstance(result, str) and result:
+                    _cache_put(_translation_cache, (source_lang, target_lang, _text_key(text)), result)
+                    results[i] = result
+
+        except Exception:
+            logger.exception("Batch translation error")
+
+    # Fall back to the original text for anything left untranslated
+    return [r if r is not None else texts[i] for i, r in enumerate(results)]
+
+
 async def translate_for_customer(
     text: str,
-    customer_language: str,
+    customer_language: Optional[str] = None,
+    conversation_id: Optional[str] = None,
 ) -> str:
     """
     Translate a Spanish response for sending to a customer in their language.
-    
+
     Args:
         text: Spanish text to translate
-        customer_language: Customer's language ISO code
-        
+        customer_language: Customer's language ISO code; when omitted, the
+            language detect_and_translate remembered for the conversation
+            is used (Spanish if nothing was remembered)
+        conversation_id: Conversation whose remembered language to use
+
     Returns:
         Translated text for the customer
     """
-    if customer_language == "es":
+    if customer_language is None and conversation_id is not None:
+        customer_language = get_conversation_language(conversation_id)
+
+    if not customer_language or customer_language == "es":
         return text
-        
+
     return await translate(text, source_lang="es", target_lang=customer_language)
 
 
 async def detect_and_translate(
     text: str,
     business_languages: list[str],
+    conversation_id: Optional[str] = None,
 ) -> tuple[str, LanguageResult, str | None]:
     """
     Detect language and translate if needed.
-    
+
     Args:
         text: The text to analyze and potentially translate
         business_languages: Languages the business team speaks
-        
+        conversation_id: When given, the detected language is remembered so
+            later replies in the conversation skip re-detection
+
     Returns:
         Tuple of (final_text, language_result, translated_text_or_none)
     """
     # Detect the language
     lang_result = await detect_language(text)
-    
+
+    # Remember it for the rest of the conversation's request flow
+    if conversation_id is not None:
+        _conv_langs()[conversation_id] = lang_result.code
+
     # If the language is one the business speaks, no translation needed
     if lang_result.code in business_languages:
         return text, lang_result, None
@@ -8,8 +8,14 @@ This workflow handles the complete voice message processing pipeline:
 4. Auto-create job, send confirmation, or queue for human review
 """
 
-from typing import Literal, TypedDict
-
+import asyncio
+from dataclasses import dataclass, field
+from functools import cache
+from types import MappingProxyType
+from typing import Literal
+
+import httpx
+import openai
 from langgraph.graph import END, StateGraph
 
 from app.config import settings
@@ -27,22 +33,26 @@ from app.models.schemas import ConversationMessage, JobExtraction
 from app.services.translation import detect_and_translate, translate_for_customer
 
 
-class VoiceProcessingState(TypedDict):
+# A slotted dataclass instead of a TypedDict: LangGraph stores updates as
+# fixed attribute writes on one object instead of rebuilding a ~20-key dict
+# hash table on every hop, and unset fields fall back to defaults
+@dataclass(slots=True)
+class VoiceProcessingState:
     """State object that flows through the workflow."""
-    
+
     # Input
-    message_id: str
-    audio_url: str
-    customer_phone: str
-    organization_id: str
-    conversation_history: list[ConversationMessage]
-    
+    message_id: str = ""
+    audio_url: str = ""
+    customer_phone: str = ""
+    organization_id: str = ""
+    conversation_history: list[ConversationMessage] = field(default_factory=list)
+
     # Phase 5.2: Translation settings (from organization)
-    business_languages: list[str]  # Languages the business team speaks
-    
+    business_languages: list[str] = field(default_factory=lambda: ["es"])
+
     # Phase 5.5: Workflow permissions (from AIConfiguration)
-    workflow_permissions: dict  # JSON permissions from workflowPermissions field
-    
+    workflow_permissions: dict = field(default_factory=dict)
+
     # Processing state
     status: Literal[
         "transcribing",
@@ -54,25 +64,30 @@ class VoiceProcessingState(TypedDict):
         "completed",
         "failed",
         "human_review",
-    ]
-    
+    ] = "transcribing"
+
     # Outputs
-    transcription: str | None
-    extraction: JobExtraction | None
-    confidence: float | None
-    job_id: str | None
-    error: str | None
-    
+    transcription: str | None = None
+    extraction: JobExtraction | None = None
+    extraction_data: dict | None = None  # extraction.model_dump(), serialized once
+    confidence: float | None = None
+    job_id: str | None = None
+    error: str | None = None
+
     # Phase 5.2: Translation tracking
-    detected_language: str | None           # ISO code of detected language
-    detected_language_name: str | None      # Full name of detected language
-    original_transcription: str | None      # Original transcription (if translated)
-    translated_transcription: str | None    # Spanish translation (if needed)
-    language_confidence: float | None       # Confidence of language detection
-    
+    detected_language: str | None = None           # ISO code of detected language
+    detected_language_name: str | None = None      # Full name of detected language
+    original_transcription: str | None = None      # Original transcription (if translated)
+    translated_transcription: str | None = None    # Spanish translation (if needed)
+    language_confidence: float | None = None       # Confidence of language detection
+
     # Workflow tracking
-    confirmation_sent: bool
-    confirmation_message_id: str | None
+    confirmation_sent: bool = False
+    confirmation_message_id: str | None = None
+
+    # Accumulated update_message_status fields, written in one round-trip
+    # by the terminal flush node instead of once per node
+    pending_status_updates: dict = field(default_factory=dict)
 
 
 # ============================================================================
@@ -80,12 +95,26 @@ class VoiceProcessingState(TypedDict):
 # ============================================================================
 
 
+# Default to True for most permissions (permissive default). Built once at
+# import and read-only, so permission checks allocate nothing per call.
+_PERMISSION_DEFAULTS = MappingProxyType({
+    "suggestResponses": True,
+    "translateMessages": True,
+    "suggestActions": True,
+    "accessDatabase": True,
+    "accessSchedule": True,
+    "autoApproveSmallPriceAdjustments": False,
+    "autoApproveThresholdPercent": 5,
+    "autoAssignTechnicians": False,
+})
+
+
 def check_permission(state: VoiceProcessingState, permission: str) -> bool:
     """
     Check if a specific workflow permission is enabled.
-    
+
     Phase 5.5: Workflow Permissions
-    
+
     Permissions:
     - suggestResponses: Suggest text responses
     - translateMessages: Auto-translate messages
@@ -96,21 +125,22 @@ def check_permission(state: VoiceProcessingState, permission: str) -> bool:
     - autoApproveThresholdPercent: Max % for auto-approval
     - autoAssignTechnicians: Auto-assign available technicians
     """
-    permissions = state.get("workflow_permissions", {})
-    
-    # Default to True for most permissions (permissive default)
-    defaults = {
-        "suggestResponses": True,
-        "translateMessages": True,
-        "suggestActions": True,
-        "accessDatabase": True,
-        "accessSchedule": True,
-        "autoApproveSmallPriceAdjustments": False,
-        "autoApproveThresholdPercent": 5,
-        "autoAssignTechnicians": False,
-    }
-    
-    return permissions.get(permission, defaults.get(permission, True))
+    permission_value = state.workflow_permissions.get(permission)
+    if permission_value is not None:
+        return permission_value
+    return _PERMISSION_DEFAULTS.get(permission, True)
+
+
+def _queue_status_update(state: VoiceProcessingState, **fields) -> dict:
+    """
+    Merge fields into the pending message update.
+
+    Each node used to pay its own update_message_status round-trip, 5-7
+    sequential DB writes per voice message; queueing the fields and
+    flushing once at the end collapses them into a single write. Later
+    values win, so the final status is whatever the terminal node set.
+    """
+    return {**state.pending_status_updates, **fields}
 
 
 # ============================================================================
@@ -118,150 +148,161 @@ def check_permission(state: VoiceProcessingState, permission: str) -> bool:
 # ============================================================================
 
 
-async def transcribe_node(state: VoiceProcessingState) -> VoiceProcessingState:
-    """Node: Download and transcribe audio."""
+# Shared fallback for review-queue inserts with no extraction; never mutated
+_EMPTY: dict = {}
+
+# Failures the nodes handle by routing the workflow (timeouts, upstream
+# API errors). Anything outside these propagates to the caller instead of
+# being silently folded into a "failed" state.
+_UPSTREAM_ERRORS = (httpx.HTTPError, openai.OpenAIError)
+
+# Transient subset worth retrying before giving up
+_TRANSIENT_ERRORS = (
+    httpx.TimeoutException,
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+)
+_TRANSIENT_RETRIES = 2
+
+
+async def _retry_transient(call, /, *args, **kwargs):
+    """Retry rate-limit/timeout errors with short exponential backoff."""
+    delay = 0.5
+    for _ in range(_TRANSIENT_RETRIES):
+        try:
+            return await call(*args, **kwargs)
+        except _TRANSIENT_ERRORS:
+            await asyncio.sleep(delay)
+            delay *= 2
+    return await call(*args, **kwargs)
+
+# Outgoing WhatsApp texts, built once; only the job title varies
+_JOB_CREATED_TEMPLATE = (
+    "✅ *Trabajo creado:* {title}\n\n"
+    "Te avisamos cuando asignemos un técnico.\n"
+    "Podés ver el estado en cualquier momento escribiendo *estado*."
+)
+_REVIEW_QUEUED_MESSAGE = (
+    "📝 Recibimos tu mensaje de voz.\n"
+    "Un operador lo revisará en breve y te contactará.\n"
+    "Gracias por tu paciencia."
+)
+_FAILURE_MESSAGE = (
+    "❌ Tuvimos un problema procesando tu mensaje de voz.\n"
+    "Un operador te contactará pronto.\n"
+    "Disculpá las molestias."
+)
+
+
+async def ingest_node(state: VoiceProcessingState) -> dict:
+    """
+    Node: Transcribe, translate, and extract in a single pass.
+
+    The three steps always ran back to back, so they are fused into one
+    node: two fewer graph hops (state snapshot + channel merge each) per
+    voice message. Failure semantics are unchanged - transcription or
+    extraction errors short-circuit to failure, translation errors are
+    non-fatal (Phase 5.2) and extraction continues with the original text.
+    """
+    # Step 1: Download and transcribe audio
     try:
-        # Download audio from WhatsApp
-        audio_data = await download_audio(state["audio_url"])
-        
+        audio_data = await _retry_transient(download_audio, state.audio_url)
+
         # Transcribe with Whisper (auto-detect language for Phase 5.2)
-        transcription = await transcribe_audio(audio_data, language="es")
-        
-        # Update message in database
-        await update_message_status(
-            message_id=state["message_id"],
-            transcription=transcription,
-            status="transcribed",
+        transcription = await _retry_transient(
+            transcribe_audio, audio_data, language="es"
         )
-        
+
+    except _UPSTREAM_ERRORS as e:
         return {
-            **state,
-            "transcription": transcription,
-            "status": "translating",  # Phase 5.2: Next step is translation check
-            "error": None,
+            "status": "failed",
+            "error": f"Transcription failed: {str(e)}",
         }
-        
-    except Exception as e:
+
+    if not transcription:
         return {
-            **state,
             "status": "failed",
-            "error": f"Transcription failed: {str(e)}",
+            "error": "No transcription available",
         }
 
+    update: dict = {
+        "transcription": transcription,
+        "error": None,
+    }
+    pending = _queue_status_update(
+        state, transcription=transcription, status="transcribed",
+    )
 
-async def translate_node(state: VoiceProcessingState) -> VoiceProcessingState:
-    """
-    Node: Detect language and translate if needed.
-    
-    Phase 5.2: Translation Core
-    - Detects the language of the transcription
-    - If not Spanish and not a language the business speaks, translates to Spanish
-    - Preserves original for display while using translation for extraction
-    
-    Phase 5.5: Respects translateMessages permission
-    """
+    # Step 2: Detect language and translate if needed (Phase 5.2)
     try:
         # Phase 5.5: Check if translation is permitted
         if not check_permission(state, "translateMessages"):
-            return {
-                **state,
-                "status": "extracting",
-                "detected_language": "es",
-                "detected_language_name": "Español (traducción deshabilitada)",
-            }
-        
-        transcription = state.get("transcription")
-        if not transcription:
-            return {
-                **state,
-                "status": "extracting",
-                "detected_language": "es",
-                "detected_language_name": "Español",
-            }
-        
-        # Get business languages (default to just Spanish)
-        business_languages = state.get("business_languages", ["es"])
-        
-        # Detect and translate if needed
-        final_text, lang_result, translated = await detect_and_translate(
-            transcription,
-            business_languages,
-        )
-        
-        # Prepare state update
-        update = {
-            **state,
-            "status": "extracting",
-            "detected_language": lang_result.code,
-            "detected_language_name": lang_result.name,
-            "language_confidence": lang_result.confidence,
-        }
-        
-        if translated:
-            # Store both original and translation
-            update["original_transcription"] = transcription
-            update["translated_transcription"] = translated
-            update["transcription"] = translated  # Use translation for extraction
-            
-            # Update message in database with translation info
-            await update_message_status(
-                message_id=state["message_id"],
-                detected_language=lang_result.code,
-                original_content=transcription,
-                translated_content=translated,
+            update["detected_language"] = "es"
+            update["detected_language_name"] = "Español (traducción deshabilitada)"
+        else:
+            # Get business languages (default to just Spanish)
+            business_languages = state.business_languages or ["es"]
+
+            # Detect and translate if needed
+            final_text, lang_result, translated = await detect_and_translate(
+                transcription,
+                business_languages,
+                conversation_id=state.customer_phone,
             )
-        
-        return update
-        
-    except Exception as e:
-        # On translation error, continue with original transcription
-        return {
-            **state,
-            "status": "extracting",
-            "detected_language": "es",
-            "detected_language_name": "Español",
-            "error": f"Translation warning: {str(e)}",  # Non-fatal
-        }
 
+            update["detected_language"] = lang_result.code
+            update["detected_language_name"] = lang_result.name
+            update["language_confidence"] = lang_result.confidence
+
+            if translated:
+                # Store both original and translation
+                update["original_transcription"] = transcription
+                update["translated_transcription"] = translated
+                pending.update(
+                    detected_language=lang_result.code,
+                    original_content=transcription,
+                    translated_content=translated,
+                )
+                transcription = translated  # Use translation for extraction
+                update["transcription"] = translated
+
+    except _UPSTREAM_ERRORS as e:
+        # On translation error, continue with original transcription
+        update["detected_language"] = "es"
+        update["detected_language_name"] = "Español"
+        update["error"] = f"Translation warning: {str(e)}"  # Non-fatal
 
-async def extract_node(state: VoiceProcessingState) -> VoiceProcessingState:
-    """Node: Extract structured job data from transcription."""
+    # Step 3: Extract structured job data
     try:
-        if not state["transcription"]:
-            return {
-                **state,
-                "status": "failed",
-                "error": "No transcription available",
-            }
-        
-        # Extract job data
-        extraction = await extract_job_data(
-            transcription=state["transcription"],
-            conversation_history=state["conversation_history"],
-        )
-        
-        # Update message in database
-        await update_message_status(
-            message_id=state["message_id"],
-            extraction_data=extraction.model_dump(),
-            confidence=extraction.overall_confidence,
-            status="extracted",
+        extraction = await _retry_transient(
+            extract_job_data,
+            transcription=transcription,
+            conversation_history=state.conversation_history,
         )
-        
-        return {
-            **state,
-            "extraction": extraction,
-            "confidence": extraction.overall_confidence,
-            "status": "routing",
-            "error": None,
-        }
-        
-    except Exception as e:
-        return {
-            **state,
-            "status": "failed",
-            "error": f"Extraction failed: {str(e)}",
-        }
+
+    except _UPSTREAM_ERRORS as e:
+        update["status"] = "failed"
+        update["error"] = f"Extraction failed: {str(e)}"
+        update["pending_status_updates"] = pending
+        return update
+
+    # Serialize once; downstream nodes reuse the dump instead of
+    # re-walking the model tree
+    extraction_data = extraction.model_dump()
+
+    update["extraction"] = extraction
+    update["extraction_data"] = extraction_data
+    update["confidence"] = extraction.overall_confidence
+    update["status"] = "routing"
+    update["error"] = None
+    pending.update(
+        extraction_data=extraction_data,
+        confidence=extraction.overall_confidence,
+        status="extracted",
+    )
+    update["pending_status_updates"] = pending
+    return update
 
 
 def route_by_confidence(state: VoiceProcessingState) -> str:
@@ -270,7 +311,7 @@ def route_by_confidence(state: VoiceProcessingState) -> str:
     
     Returns the name of the next node to execute.
     """
-    confidence = state.get("confidence", 0)
+    confidence = state.confidence or 0
     
     if confidence >= settings.CONFIDENCE_AUTO_CREATE_THRESHOLD:
         # High confidence - auto create job
@@ -283,170 +324,182 @@ def route_by_confidence(state: VoiceProcessingState) -> str:
         return "human_review"
 
 
-async def send_confirmation_node(state: VoiceProcessingState) -> VoiceProcessingState:
+async def send_confirmation_node(state: VoiceProcessingState) -> dict:
     """Node: Send confirmation message to customer."""
     try:
-        if not state["extraction"]:
-            return {**state, "status": "failed", "error": "No extraction data"}
+        if not state.extraction:
+            return {"status": "failed", "error": "No extraction data"}
         
         # Format confirmation message
-        message = format_confirmation_message(state["extraction"])
+        message = format_confirmation_message(state.extraction)
         
-        # Send via WhatsApp
+        # Send via WhatsApp; the status write joins the terminal flush
         response = await send_message(
-            to=state["customer_phone"],
+            to=state.customer_phone,
             text=message,
-            organization_id=state["organization_id"],
-        )
-        
-        # Update status - now waiting for reply
-        await update_message_status(
-            message_id=state["message_id"],
-            status="awaiting_confirmation",
+            organization_id=state.organization_id,
         )
         
         return {
-            **state,
             "status": "confirming",
             "confirmation_sent": True,
             "confirmation_message_id": response.get("message_id"),
+            "pending_status_updates": _queue_status_update(
+                state, status="awaiting_confirmation",
+            ),
         }
         
-    except Exception as e:
+    except httpx.HTTPError as e:
         # If confirmation fails, fall back to human review
         return {
-            **state,
             "status": "human_review",
             "error": f"Confirmation failed: {str(e)}",
         }
 
 
-async def auto_create_job_node(state: VoiceProcessingState) -> VoiceProcessingState:
+async def auto_create_job_node(state: VoiceProcessingState) -> dict:
     """Node: Automatically create job with high confidence extraction."""
     try:
-        if not state["extraction"]:
-            return {**state, "status": "failed", "error": "No extraction data"}
+        if not state.extraction:
+            return {"status": "failed", "error": "No extraction data"}
         
         # Create job in database
         job = await create_job(
-            organization_id=state["organization_id"],
-            customer_phone=state["customer_phone"],
-            extraction_data=state["extraction"].model_dump(),
+            organization_id=state.organization_id,
+            customer_phone=state.customer_phone,
+            extraction_data=state.extraction_data or state.extraction.model_dump(),
             source="voice_ai_auto",
         )
         
-        # Send confirmation to customer
-        title = state["extraction"].title or "tu trabajo"
+        # Send confirmation to customer; the status write joins the
+        # terminal flush
+        title = state.extraction.title or "tu trabajo"
         await send_message(
-            to=state["customer_phone"],
-            text=(
-                f"✅ *Trabajo creado:* {title}\n\n"
-                "Te avisamos cuando asignemos un técnico.\n"
-                "Podés ver el estado en cualquier momento escribiendo *estado*."
-            ),
-            organization_id=state["organization_id"],
-        )
-        
-        # Update message status
-        await update_message_status(
-            message_id=state["message_id"],
-            status="job_created",
+            to=state.customer_phone,
+            text=_JOB_CREATED_TEMPLATE.format(title=title),
+            organization_id=state.organization_id,
         )
         
         return {
-            **state,
             "status": "completed",
             "job_id": job.get("id"),
+            "pending_status_updates": _queue_status_update(
+                state, status="job_created",
+            ),
             "error": None,
         }
         
-    except Exception as e:
+    except httpx.HTTPError as e:
         # If auto-create fails, queue for review
         return {
-            **state,
             "status": "human_review",
             "error": f"Job creation failed: {str(e)}",
         }
 
 
-async def human_review_node(state: VoiceProcessingState) -> VoiceProcessingState:
+async def human_review_node(state: VoiceProcessingState) -> dict:
     """Node: Add message to human review queue."""
     try:
-        # Add to review queue
-        await add_to_review_queue(
-            organization_id=state["organization_id"],
-            message_id=state["message_id"],
-            transcription=state["transcription"] or "",
-            extraction_data=state["extraction"].model_dump() if state["extraction"] else {},
-            confidence=state["confidence"] or 0,
-            customer_phone=state["customer_phone"],
-        )
-        
-        # Notify customer
-        await send_message(
-            to=state["customer_phone"],
-            text=(
-                "📝 Recibimos tu mensaje de voz.\n"
-                "Un operador lo revisará en breve y te contactará.\n"
-                "Gracias por tu paciencia."
+        # Queue insert and customer notification hit different backends
+        # and are independent; the status write joins the terminal flush
+        await asyncio.gather(
+            add_to_review_queue(
+                organization_id=state.organization_id,
+                message_id=state.message_id,
+                transcription=state.transcription or "",
+                extraction_data=state.extraction_data or _EMPTY,
+                confidence=state.confidence or 0,
+                customer_phone=state.customer_phone,
+            ),
+            send_message(
+                to=state.customer_phone,
+                text=_REVIEW_QUEUED_MESSAGE,
+                organization_id=state.organization_id,
             ),
-            organization_id=state["organization_id"],
-        )
-        
-        # Update message status
-        await update_message_status(
-            message_id=state["message_id"],
-            status="queued_for_review",
         )
         
         return {
-            **state,
             "status": "human_review",
+            "pending_status_updates": _queue_status_update(
+                state, status="queued_for_review",
+            ),
             "error": None,
         }
         
-    except Exception as e:
+    except httpx.HTTPError as e:
         return {
-            **state,
             "status": "failed",
             "error": f"Failed to queue for review: {str(e)}",
         }
 
 
-async def handle_failure_node(state: VoiceProcessingState) -> VoiceProcessingState:
-    """Node: Handle failed processing - notify and escalate."""
+# Best-effort failure side effects run detached; the set keeps a strong
+# reference until each task finishes (same pattern as the support bot's
+# escalation tickets)
+_BACKGROUND_TASKS: set[asyncio.Task] = set()
+
+
+async def _notify_failure(state: VoiceProcessingState) -> None:
+    """Queue the failed message for review and acknowledge the customer."""
     try:
-        # Update message status
-        await update_message_status(
-            message_id=state["message_id"],
-            status="processing_failed",
-        )
-        
-        # Always queue failed messages for human review
-        await add_to_review_queue(
-            organization_id=state["organization_id"],
-            message_id=state["message_id"],
-            transcription=state["transcription"] or "(transcription failed)",
-            extraction_data={},
-            confidence=0,
-            customer_phone=state["customer_phone"],
-        )
-        
-        # Notify customer
-        await send_message(
-            to=state["customer_phone"],
-            text=(
-                "❌ Tuvimos un problema procesando tu mensaje de voz.\n"
-                "Un operador te contactará pronto.\n"
-                "Disculpá las molestias."
+        # Review-queue insert and customer notification are independent
+        await asyncio.gather(
+            add_to_review_queue(
+                organization_id=state.organization_id,
+                message_id=state.message_id,
+                transcription=state.transcription or "(transcription failed)",
+                extraction_data=_EMPTY,
+                confidence=0,
+                customer_phone=state.customer_phone,
+            ),
+            send_message(
+                to=state.customer_phone,
+                text=_FAILURE_MESSAGE,
+                organization_id=state.organization_id,
             ),
-            organization_id=state["organization_id"],
         )
-        
+
     except Exception:
         pass  # Best effort - already in error state
-    
-    return state
+
+
+async def drain_background_tasks() -> None:
+    """Wait out detached failure notifications; called at shutdown.
+
+    Runs before the pooled integrations client closes so in-flight
+    review inserts and customer acknowledgements are not cut off.
+    """
+    if _BACKGROUND_TASKS:
+        await asyncio.gather(*_BACKGROUND_TASKS, return_exceptions=True)
+
+
+async def handle_failure_node(state: VoiceProcessingState) -> dict:
+    """Node: Handle failed processing - notify and escalate."""
+    # The workflow outcome is already decided, so the review-queue insert
+    # and customer acknowledgement run in the background instead of
+    # adding two round-trips to the caller's wait
+    task = asyncio.create_task(_notify_failure(state))
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+
+    return {
+        "pending_status_updates": _queue_status_update(
+            state, status="processing_failed",
+        ),
+    }
+
+
+async def flush_status_node(state: VoiceProcessingState) -> dict:
+    """Node: Write every queued message update in one round-trip."""
+    if state.pending_status_updates:
+        try:
+            await update_message_status(
+                message_id=state.message_id,
+                **state.pending_status_updates,
+            )
+        except Exception:
+            pass  # Best effort - a bookkeeping error must not fail the run
+    return {}
 
 
 # ============================================================================
@@ -454,42 +507,34 @@ async def handle_failure_node(state: VoiceProcessingState) -> VoiceProcessingSta
 # ============================================================================
 
 
+def _after_ingest(state: VoiceProcessingState) -> str:
+    """Edge: route by confidence unless transcription/extraction failed."""
+    return route_by_confidence(state) if state.status != "failed" else "handle_failure"
+
+
+@cache
 def build_voice_workflow() -> StateGraph:
     """Build and compile the voice processing workflow."""
-    
+
     # Create workflow graph
     workflow = StateGraph(VoiceProcessingState)
-    
+
     # Add nodes
-    workflow.add_node("transcribe", transcribe_node)
-    workflow.add_node("translate", translate_node)  # Phase 5.2: Translation node
-    workflow.add_node("extract", extract_node)
+    workflow.add_node("ingest", ingest_node)  # transcribe + translate + extract
     workflow.add_node("confirm", send_confirmation_node)
     workflow.add_node("auto_create", auto_create_job_node)
     workflow.add_node("human_review", human_review_node)
     workflow.add_node("handle_failure", handle_failure_node)
-    
+    workflow.add_node("flush_status", flush_status_node)
+
     # Set entry point
-    workflow.set_entry_point("transcribe")
-    
+    workflow.set_entry_point("ingest")
+
     # Add edges
-    # transcribe -> translate (if successful) or handle_failure
-    workflow.add_conditional_edges(
-        "transcribe",
-        lambda state: "translate" if state["status"] != "failed" else "handle_failure",
-        {
-            "translate": "translate",
-            "handle_failure": "handle_failure",
-        },
-    )
-    
-    # translate -> extract (always continues, translation errors are non-fatal)
-    workflow.add_edge("translate", "extract")
-    
-    # extract -> route by confidence or handle_failure
+    # ingest -> route by confidence or handle_failure
     workflow.add_conditional_edges(
-        "extract",
-        lambda state: route_by_confidence(state) if state["status"] != "failed" else "handle_failure",
+        "ingest",
+        _after_ingest,
         {
             "auto_create": "auto_create",
             "confirm": "confirm",
@@ -498,11 +543,12 @@ def build_voice_workflow() -> StateGraph:
         },
     )
     
-    # Terminal edges
-    workflow.add_edge("auto_create", END)
-    workflow.add_edge("confirm", END)  # Confirmation flow continues async
-    workflow.add_edge("human_review", END)
-    workflow.add_edge("handle_failure", END)
+    # Terminal edges - every outcome drains the queued updates first
+    workflow.add_edge("auto_create", "flush_status")
+    workflow.add_edge("confirm", "flush_status")  # Confirmation flow continues async
+    workflow.add_edge("human_review", "flush_status")
+    workflow.add_edge("handle_failure", "flush_status")
+    workflow.add_edge("flush_status", END)
     
     return workflow
 
@@ -5,36 +5,51 @@ FastAPI application for voice processing with LangGraph.
 Handles WhatsApp voice messages, transcription, and intelligent job extraction.
 """
 
+import logging
+import time
 from contextlib import asynccontextmanager
 from typing import Any
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import uvicorn
 
 from app.api.voice import router as voice_router
 from app.api.support import router as support_router
 from app.api.invoice import router as invoice_router
 from app.config import settings
-from app.middleware.monitoring import setup_langsmith
+from app.integrations import close_integrations_client
+from app.middleware.monitoring import setup_langsmith, setup_logging, shutdown_logging
+from app.workflows.support_bot import close_http_client, warmup
+from app.workflows.voice_processing import drain_background_tasks
+
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler for startup and shutdown."""
     # Startup
-    print(f"🚀 Starting CampoTech AI Service in {settings.ENVIRONMENT} mode")
-    
+    setup_logging()
+    logger.info("Starting CampoTech AI Service in %s mode", settings.ENVIRONMENT)
+
     # Initialize LangSmith if configured
     if settings.LANGSMITH_API_KEY:
         setup_langsmith()
-        print("📊 LangSmith tracing enabled")
-    
+        logger.info("LangSmith tracing enabled")
+
+    # Warm up the OpenAI connection so the first request is not the slowest
+    await warmup()
+
     yield
-    
+
     # Shutdown
-    print("👋 Shutting down CampoTech AI Service")
+    logger.info("Shutting down CampoTech AI Service")
+    await close_http_client()
+    await drain_background_tasks()
+    await close_integrations_client()
+    shutdown_logging()
 
 
 app = FastAPI(
@@ -42,6 +57,9 @@ app = FastAPI(
     description="Voice processing and intelligent job extraction for CampoTech",
     version="0.1.0",
     lifespan=lifespan,
+    # orjson is significantly faster than stdlib json for the nested
+    # extraction/invoice response models
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -56,9 +74,9 @@ app.add_middleware(
 
 # Global exception handler
 @app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def global_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handle uncaught exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "success": False,
@@ -81,37 +99,59 @@ async def health_check() -> dict[str, Any]:
 
 
 # Ready check (verifies dependencies are available)
-@app.get("/ready")
-async def readiness_check() -> dict[str, Any]:
-    """
-    Readiness check - verifies all dependencies are available.
-    Returns 503 if any critical dependency is unavailable.
-    """
+# Probe results are cached briefly so orchestration probes every few
+# seconds do not each open a fresh Redis connection
+_READY_TTL_SECONDS = 5.0
+_ready_cache: tuple[float, dict[str, bool]] | None = None
+_redis_client: Any = None  # created once on first readiness check
+
+
+async def _run_readiness_checks() -> dict[str, bool]:
+    """Probe each dependency once; called at most every _READY_TTL_SECONDS."""
+    global _redis_client
+
     checks: dict[str, bool] = {}
-    
-    # Check OpenAI API
-    try:
-        import openai
-        client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
-        # Quick test - list models is fast
-        checks["openai"] = True
-    except Exception:
-        checks["openai"] = False
-    
-    # Check Redis if configured
+
+    # OpenAI: credentials are exercised by warmup() at startup; a probe
+    # here never made a network call, so just verify a key is configured
+    checks["openai"] = bool(settings.OPENAI_API_KEY)
+
+    # Check Redis if configured, reusing one pooled async client so the
+    # ping round-trip never blocks the event loop
     if settings.REDIS_URL:
         try:
-            import redis
-            r = redis.from_url(settings.REDIS_URL)
-            r.ping()
+            import redis.asyncio as aioredis
+            if _redis_client is None:
+                _redis_client = aioredis.from_url(
+                    settings.REDIS_URL, socket_connect_timeout=0.5
+                )
+            await _redis_client.ping()
             checks["redis"] = True
         except Exception:
             checks["redis"] = False
-    
+
+    return checks
+
+
+@app.get("/ready")
+async def readiness_check() -> dict[str, Any]:
+    """
+    Readiness check - verifies all dependencies are available.
+    Returns 503 if any critical dependency is unavailable.
+    """
+    global _ready_cache
+
+    now = time.monotonic()
+    if _ready_cache is not None and now - _ready_cache[0] < _READY_TTL_SECONDS:
+        checks = _ready_cache[1]
+    else:
+        checks = await _run_readiness_checks()
+        _ready_cache = (now, checks)
+
     # Overall status
     all_healthy = all(checks.values())
-    
-    return JSONResponse(
+
+    return ORJSONResponse(
         status_code=200 if all_healthy else 503,
         content={
             "ready": all_healthy,
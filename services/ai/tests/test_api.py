@@ -8,20 +8,24 @@ from fastapi.testclient import TestClient
 from main import app
 
 
-client = TestClient(app)
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient (and app lifespan) shared by the whole session."""
+    with TestClient(app) as c:
+        yield c
 
 
 class TestHealthEndpoints:
     """Tests for health check endpoints."""
-    
-    def test_health_check(self):
+
+    def test_health_check(self, client):
         """Health endpoint should return 200."""
         response = client.get("/health")
         assert response.status_code == 200
         assert response.json()["status"] == "healthy"
         assert response.json()["service"] == "campotech-ai"
-    
-    def test_health_includes_version(self):
+
+    def test_health_includes_version(self, client):
         """Health endpoint should include version."""
         response = client.get("/health")
         assert "version" in response.json()
@@ -29,13 +33,13 @@ class TestHealthEndpoints:
 
 class TestVoiceEndpoints:
     """Tests for voice processing endpoints."""
-    
-    def test_process_requires_body(self):
+
+    def test_process_requires_body(self, client):
         """Process endpoint should require request body."""
         response = client.post("/api/voice/process")
         assert response.status_code == 422  # Validation error
-    
-    def test_process_validates_required_fields(self):
+
+    def test_process_validates_required_fields(self, client):
         """Process endpoint should validate required fields."""
         response = client.post(
             "/api/voice/process",
@@ -0,0 +1,150 @@
+"""
+Tests for the streaming invoice extraction scanner.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import orjson
+import pytest
+
+from app.services import invoice_extraction
+from app.services.invoice_extraction import PriceItem, _StreamingItemScanner
+
+
+_RESPONSE = (
+    '{"js": "resumen", "wp": "trabajo", "pu": ['
+    '{"n": "caño de PVC", "q": 2, "u": "metro", "st": "dos caños"}, '
+    '{"n": "codo 90", "q": 1, "u": "unidad", "st": "un codo"}'
+    '], "sp": ['
+    '{"d": "reparación de pérdida", "dm": 90, "t": "reparacion", "st": "arreglé la pérdida"}'
+    '], "fu": false}'
+)
+
+
+def _feed_chunked(scanner: _StreamingItemScanner, text: str, chunk_size: int) -> list:
+    items = []
+    for i in range(0, len(text), chunk_size):
+        items.extend(scanner.feed(text[i:i + chunk_size]))
+    return items
+
+
+class TestStreamingItemScanner:
+    """Tests for incremental part/service detection in streamed JSON."""
+
+    def test_detects_parts_and_services(self):
+        """Each completed object should be reported with its array kind."""
+        items = _StreamingItemScanner().feed(_RESPONSE)
+
+        assert [kind for kind, _ in items] == ["part", "part", "service"]
+        assert items[0][1]["n"] == "caño de PVC"
+        assert items[1][1]["q"] == 1
+        assert items[2][1]["d"] == "reparación de pérdida"
+
+    def test_single_character_deltas(self):
+        """Tokens split across chunk boundaries must not confuse the scanner."""
+        items = _feed_chunked(_StreamingItemScanner(), _RESPONSE, 1)
+
+        assert [kind for kind, _ in items] == ["part", "part", "service"]
+        assert items[0][1]["st"] == "dos caños"
+
+    def test_braces_and_brackets_inside_strings(self):
+        """Braces/brackets in string values are data, not structure."""
+        response = (
+            '{"pu": [{"n": "llave {codo} [1/2]", "q": 1, "u": "unidad", '
+            '"st": "la llave } rota ["}], "sp": []}'
+        )
+        items = _feed_chunked(_StreamingItemScanner(), response, 3)
+
+        assert len(items) == 1
+        kind, item = items[0]
+        assert kind == "part"
+        assert item["n"] == "llave {codo} [1/2]"
+        assert item["st"] == "la llave } rota ["
+
+    def test_escaped_quotes_inside_strings(self):
+        """Escaped quotes must not terminate the string early."""
+        response = (
+            '{"pu": [{"n": "cable \\"tipo taller\\"", "q": 3, "u": "metro", '
+            '"st": "tres metros"}], "sp": []}'
+        )
+        items = _feed_chunked(_StreamingItemScanner(), response, 2)
+
+        assert len(items) == 1
+        assert items[0][1]["n"] == 'cable "tipo taller"'
+
+    def test_ignores_objects_outside_tracked_arrays(self):
+        """Objects in other keys (or nested values) are not reported as items."""
+        response = (
+            '{"meta": [{"n": "no soy una parte"}], '
+            '"pu": [{"n": "burlete", "q": 1, "u": "unidad", "st": "el burlete"}], '
+            '"sp": []}'
+        )
+        items = _StreamingItemScanner().feed(response)
+
+        assert [(kind, item["n"]) for kind, item in items] == [("part", "burlete")]
+
+    def test_accumulates_full_text(self):
+        """scanner.text must hold the complete response for the final parse."""
+        scanner = _StreamingItemScanner()
+        _feed_chunked(scanner, _RESPONSE, 7)
+
+        assert scanner.text == _RESPONSE
+        assert orjson.loads(scanner.text)["js"] == "resumen"
+
+
+class TestStreamingFallback:
+    """Tests for the early-match count check in extract_invoice_data."""
+
+    @pytest.mark.asyncio
+    async def test_count_mismatch_cancels_early_tasks_and_rematches(self):
+        """A scanner/parse disagreement must fall back to a fresh match batch."""
+        response = orjson.dumps({
+            "js": "ok",
+            "wp": "cambio de caño",
+            "pu": [{"n": "caño de PVC", "q": 2, "u": "metro", "st": "dos caños"}],
+            "sp": [],
+            "at": None, "dt": None, "lh": None, "es": None, "rc": None,
+            "fu": False, "fn": None, "ph": False, "sg": False,
+        }).decode()
+
+        async def stream():
+            for i in range(0, len(response), 10):
+                delta = SimpleNamespace(content=response[i:i + 10])
+                yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+        fake_client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(
+            create=AsyncMock(return_value=stream()),
+        )))
+
+        class MiscountingScanner(_StreamingItemScanner):
+            """Reports a phantom extra part to force the count mismatch."""
+
+            def feed(self, delta):
+                items = super().feed(delta)
+                if items:
+                    items = items + [("part", {"n": "fantasma", "u": "unidad"})]
+                return items
+
+        catalog = [PriceItem(
+            id="pb-1", name="caño de PVC", description="", unit="metro",
+            price=1500.0, type="PRODUCT",
+        )]
+
+        with (
+            patch.object(invoice_extraction, "client", fake_client),
+            patch.object(invoice_extraction, "_StreamingItemScanner", MiscountingScanner),
+            patch.object(invoice_extraction, "fetch_pricebook", AsyncMock(return_value=catalog)),
+        ):
+            suggestion = await invoice_extraction.extract_invoice_data(
+                transcription="cambié dos caños de PVC",
+                organization_id="org-1",
+                job_id="job-1",
+            )
+
+        # Only the part from the parsed extraction survives - the phantom
+        # early task was cancelled, and the re-match still found the catalog hit
+        assert len(suggestion.line_items) == 1
+        item = suggestion.line_items[0]
+        assert item.matched_price_item_id == "pb-1"
+        assert item.match_confidence == 1.0
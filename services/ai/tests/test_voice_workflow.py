@@ -18,61 +18,34 @@ class TestRouteByConfidence:
     
     def test_high_confidence_routes_to_auto_create(self):
         """High confidence (>= 0.85) should auto-create."""
-        state: VoiceProcessingState = {
-            "message_id": "test",
-            "audio_url": "",
-            "customer_phone": "",
-            "organization_id": "",
-            "conversation_history": [],
-            "status": "routing",
-            "transcription": "Test",
-            "extraction": None,
-            "confidence": 0.92,
-            "job_id": None,
-            "error": None,
-            "confirmation_sent": False,
-            "confirmation_message_id": None,
-        }
+        state = VoiceProcessingState(
+            message_id="test",
+            status="routing",
+            transcription="Test",
+            confidence=0.92,
+        )
         
         assert route_by_confidence(state) == "auto_create"
     
     def test_medium_confidence_routes_to_confirm(self):
         """Medium confidence (0.50-0.84) should request confirmation."""
-        state: VoiceProcessingState = {
-            "message_id": "test",
-            "audio_url": "",
-            "customer_phone": "",
-            "organization_id": "",
-            "conversation_history": [],
-            "status": "routing",
-            "transcription": "Test",
-            "extraction": None,
-            "confidence": 0.65,
-            "job_id": None,
-            "error": None,
-            "confirmation_sent": False,
-            "confirmation_message_id": None,
-        }
+        state = VoiceProcessingState(
+            message_id="test",
+            status="routing",
+            transcription="Test",
+            confidence=0.65,
+        )
         
         assert route_by_confidence(state) == "confirm"
     
     def test_low_confidence_routes_to_human_review(self):
         """Low confidence (< 0.50) should queue for human review."""
-        state: VoiceProcessingState = {
-            "message_id": "test",
-            "audio_url": "",
-            "customer_phone": "",
-            "organization_id": "",
-            "conversation_history": [],
-            "status": "routing",
-            "transcription": "Test",
-            "extraction": None,
-            "confidence": 0.35,
-            "job_id": None,
-            "error": None,
-            "confirmation_sent": False,
-            "confirmation_message_id": None,
-        }
+        state = VoiceProcessingState(
+            message_id="test",
+            status="routing",
+            transcription="Test",
+            confidence=0.35,
+        )
         
         assert route_by_confidence(state) == "human_review"
 